@@ -1,7 +1,10 @@
 """전역 설정 관리 (전역 변수 대체)"""
-import os
+from functools import lru_cache
+from os import environ as _env
 from typing import Optional
 
+_env_get = _env.get
+
 
 class AppConfig:
     """애플리케이션 전역 설정 관리 (Singleton)"""
@@ -30,7 +33,7 @@ class AppConfig:
     def dev_mode(self) -> bool:
         """개발자 모드 상태"""
         # 환경 변수도 체크
-        env_dev = os.getenv('DEV_MODE', '').lower() in ('true', '1', 'yes')
+        env_dev = _env_get('DEV_MODE', '').lower() in ('true', '1', 'yes')
         return self._dev_mode or env_dev
     
     @dev_mode.setter
@@ -58,6 +61,7 @@ class AppConfig:
 _app_config = AppConfig()
 
 
+@lru_cache(maxsize=None)
 def get_config() -> AppConfig:
     """앱 설정 인스턴스 반환"""
     return _app_config
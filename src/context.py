@@ -1,6 +1,6 @@
 """실행 컨텍스트 관리"""
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 
 class DeviceContext:
@@ -9,6 +9,7 @@ class DeviceContext:
         """DeviceContext 초기화"""
         self.selected_loader_file: Optional[str] = None
         self.output_folder_path: Optional[Path] = None
+        self.extracted_files: set = set()
     
     def set_loader(self, loader_path: str) -> None:
         """로더 파일 경로 설정"""
@@ -25,6 +26,18 @@ class DeviceContext:
     def get_output_folder(self) -> Optional[Path]:
         """출력 폴더 경로 반환"""
         return self.output_folder_path
+    
+    def register_extracted(self, file_path: str) -> None:
+        """이번 실행에서 추출한 파일 등록 (에러 시 정리 대상)"""
+        self.extracted_files.add(file_path)
+    
+    def iter_extracted(self) -> Iterator[str]:
+        """등록된 추출 파일 순회"""
+        return iter(list(self.extracted_files))
+    
+    def clear_extracted(self) -> None:
+        """추출 파일 목록 초기화"""
+        self.extracted_files.clear()
 
 
 class CopyProgressTracker:
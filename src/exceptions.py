@@ -10,22 +10,18 @@
 
 class EDLConnectionError(Exception):
     """EDL 모드 중 연결이 끊겼을 때 발생하는 예외"""
-    pass
 
 
 class LoaderNotFoundError(Exception):
     """로더 파일을 찾을 수 없을 때 발생하는 예외"""
-    pass
 
 
 class EDLModeEntryError(Exception):
     """EDL 모드 진입에 실패했을 때 발생하는 예외"""
-    pass
 
 
 class EDLConnectionFailedError(Exception):
     """EDL 연결 확인에 실패했을 때 발생하는 예외"""
-    pass
 
 
 # 파티션 관련 예외
@@ -52,7 +48,6 @@ class PartitionOperationError(Exception):
 
 class UserCancelledError(Exception):
     """사용자가 작업을 취소했을 때 발생하는 예외"""
-    pass
 
 
 # ADB/슬롯 관련 예외
@@ -60,7 +55,6 @@ class UserCancelledError(Exception):
 
 class SlotInfoError(Exception):
     """슬롯 정보를 확인할 수 없을 때 발생하는 예외"""
-    pass
 
 
 # 분석 관련 예외
@@ -68,12 +62,10 @@ class SlotInfoError(Exception):
 
 class RegionCodeCheckError(Exception):
     """지역 코드 확인에 실패했을 때 발생하는 예외"""
-    pass
 
 
 class ModelInfoCheckError(Exception):
     """모델 정보 확인에 실패했을 때 발생하는 예외"""
-    pass
 
 
 # 패치 관련 예외
@@ -81,7 +73,6 @@ class ModelInfoCheckError(Exception):
 
 class PatchVerificationError(Exception):
     """패치 파일 검증에 실패했을 때 발생하는 예외"""
-    pass
 
 
 class PatchCreationError(Exception):
@@ -74,6 +74,10 @@ class PrintCapture:
     def flush(self) -> None:
         """버퍼 플러시"""
         self.terminal.flush()
+    
+    def isatty(self) -> bool:
+        """원본 stdout의 터미널 여부"""
+        return self.terminal.isatty()
 
 
 # 전역 변수
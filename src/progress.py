@@ -1,5 +1,6 @@
 """진행률 표시 시스템"""
 import sys
+import time
 from typing import List, Optional
 from src.config import Colors
 
@@ -11,14 +12,26 @@ total_sub_steps = 0
 step_name = ""
 sub_tasks = []
 
+# 상태별 작업 라인 캐시 (init_step_progress에서 작업 이름별로 미리 생성)
+_STEP_STATUS_MARKS = {
+    'done': f"{Colors.OKGREEN}✓{Colors.ENDC}",
+    'in_progress': f"{Colors.OKCYAN}→{Colors.ENDC}",
+    'pending': f"{Colors.WARNING}○{Colors.ENDC}",
+}
+_task_line_cache = []
+
 def init_step_progress(main_step_num: int, sub_step_count: int, task_names: List[str]) -> None:
     """STEP 진행률 초기화"""
-    global current_main_step, current_sub_step, total_sub_steps, sub_tasks, step_name
+    global current_main_step, current_sub_step, total_sub_steps, sub_tasks, step_name, _task_line_cache
     current_main_step = main_step_num
     current_sub_step = 0
     total_sub_steps = sub_step_count
     step_name = f"STEP {main_step_num}"
     sub_tasks = [(name, 'pending') for name in task_names]
+    _task_line_cache = [
+        {status: f"  {mark} {name}" for status, mark in _STEP_STATUS_MARKS.items()}
+        for name in task_names
+    ]
     print_hierarchical_progress()
 
 def update_sub_task(task_index: int, status: str) -> None:
@@ -55,13 +68,13 @@ def print_hierarchical_progress() -> None:
         )
         
         if sub_tasks:
-            for task_name, status in sub_tasks:
-                if status == 'done':
-                    print(f"  {Colors.OKGREEN}✓{Colors.ENDC} {task_name}")
-                elif status == 'in_progress':
-                    print(f"  {Colors.OKCYAN}→{Colors.ENDC} {task_name}")
+            for index, (task_name, status) in enumerate(sub_tasks):
+                if index < len(_task_line_cache):
+                    lines = _task_line_cache[index]
+                    print(lines.get(status, lines['pending']))
                 else:
-                    print(f"  {Colors.WARNING}○{Colors.ENDC} {task_name}")
+                    mark = _STEP_STATUS_MARKS.get(status, _STEP_STATUS_MARKS['pending'])
+                    print(f"  {mark} {task_name}")
     print()
 
 def global_print_progress(current_step: int, total_steps: int, description: str) -> None:
@@ -88,6 +101,11 @@ _standalone_tasks = []
 _standalone_title = ""
 _standalone_overall_step = None  # (현재_STEP, 전체_STEP) 튜플
 
+# 같은 상태를 짧은 간격으로 반복 출력하지 않도록 마지막 출력 상태/시각 기록
+_STANDALONE_REDRAW_INTERVAL = 0.1  # 초
+_last_standalone_state = None
+_last_standalone_draw = 0.0
+
 def init_standalone_progress(title: str, task_names: List[str], 
                              overall_step: Optional[tuple] = None) -> None:
     """독립 작업 진행률 초기화
@@ -98,11 +116,12 @@ def init_standalone_progress(title: str, task_names: List[str],
         overall_step: (현재_STEP, 전체_STEP) 튜플. 예: (2, 4)
                      None이면 전체 진행 헤더 표시하지 않음
     """
-    global _standalone_tasks, _standalone_title, _standalone_overall_step
+    global _standalone_tasks, _standalone_title, _standalone_overall_step, _last_standalone_state
     _standalone_title = title
     _standalone_tasks = [(name, 'pending') for name in task_names]
     _standalone_overall_step = overall_step
-    print_standalone_progress()
+    _last_standalone_state = None
+    print_standalone_progress(force=True)
 
 
 def update_standalone_task(task_index: int, status: str) -> None:
@@ -118,13 +137,28 @@ def update_standalone_task(task_index: int, status: str) -> None:
         _standalone_tasks[task_index] = (task_name, status)
 
 
-def print_standalone_progress() -> None:
-    """독립 작업 진행률 출력"""
+def print_standalone_progress(force: bool = False) -> None:
+    """독립 작업 진행률 출력
+    
+    직전 출력과 상태가 같고 0.1초가 지나지 않았으면 다시 그리지 않습니다.
+    
+    Args:
+        force: True면 항상 출력 (오류/완료 등 마지막 상태 표시용)
+    """
+    global _last_standalone_state, _last_standalone_draw
     bar_length = 20
     
     if not _standalone_tasks:
         return
     
+    state = (_standalone_title, tuple(_standalone_tasks), _standalone_overall_step)
+    now = time.monotonic()
+    if (not force and state == _last_standalone_state
+            and now - _last_standalone_draw < _STANDALONE_REDRAW_INTERVAL):
+        return
+    _last_standalone_state = state
+    _last_standalone_draw = now
+    
     # 완료된 작업 개수 계산
     done_count = sum(1 for _, status in _standalone_tasks if status == 'done')
     total_count = len(_standalone_tasks)
@@ -160,10 +194,11 @@ def print_standalone_progress() -> None:
 
 def end_standalone_progress() -> None:
     """독립 작업 진행률 종료"""
-    global _standalone_tasks, _standalone_title, _standalone_overall_step
+    global _standalone_tasks, _standalone_title, _standalone_overall_step, _last_standalone_state
     _standalone_tasks = []
     _standalone_title = ""
     _standalone_overall_step = None
+    _last_standalone_state = None
     sys.stdout.flush()
 
 
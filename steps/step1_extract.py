@@ -1,5 +1,6 @@
 """STEP 1: 기기 정보 추출 - 실제 코드"""
 # 표준 라이브러리
+import mmap
 import os
 import re
 import shutil
@@ -8,20 +9,22 @@ import sys
 import time
 import traceback
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 # 로컬 모듈
 from src.config import Colors
-from src.config import ADB_EXE, EDL_NG_EXE, AVBTOOL_PY, LOADER_FILES, ROMFILE_PATCH_BACKUP_DIR
+from src.config import ADB_EXE, EDL_NG_EXE, LOADER_FILES, ROMFILE_PATCH_BACKUP_DIR
 from src.config import get_model_config, UIConstants, TimingConstants
 from src.config import ErrorMessages, InfoMessages, TitleMessages, WARNING_BANNER
 from src.exceptions import EDLConnectionError
 from src.progress import init_step_progress, update_sub_task, global_print_progress, global_end_progress
 from src.context import DeviceContext
-from src.logger import log_error, log_step_start, log_step_end
+from src.logger import info, log_error, log_step_start, log_step_end, log_validation, log_extraction
 from utils.ui import show_popup, clear_screen
 from utils.command import run_command
+from utils.avb_tools import cached_avbtool_info
 from utils.region_check import validate_region_code
 from utils.edl_workflow import is_edl_disconnection_error, is_gpt_parsing_error, handle_gpt_parsing_error
 from utils.device_utils import (
@@ -33,24 +36,35 @@ from utils.device_utils import (
 # 모듈 레벨 컨텍스트 (전역 변수 대체)
 _device_context = DeviceContext()
 
+# avbtool 출력 파싱용 정규식
+# fingerprint Prop 라인 전체를 한 번에 매칭 (그룹: 1=모델, 2=롬 버전, 4=국가 코드)
+_FINGERPRINT_RE = re.compile(
+    r"^[ \t]*Prop:[^\n]*?fingerprint[^\n]*?"
+    r"'[^/\n]+/([^/\n]+)/[^:\n]+:[^/\n]+/(([^:\n]+_(PRC|ROW))):user/release-keys'",
+    re.MULTILINE
+)
+_FINGERPRINT_PROP_RE = re.compile(r"^[ \t]*Prop:[^\n]*fingerprint", re.MULTILINE)
+_ROLLBACK_RE = re.compile(r"Rollback Index:\s*(\d+)")
+
 
 def _cleanup_temp_files_on_error() -> None:
     """에러 발생 시 임시 파일 정리"""
-    from core.logger import info
-    
     print(f"\n[정보] 임시 파일을 정리합니다...")
     
-    # 1. CURRENT_DIR의 .img 파일들 삭제
-    from config.paths import CURRENT_DIR
+    # 1. 이번 실행에서 추출한 파일들 삭제 (사용자 파일은 건드리지 않음)
     deleted_files = []
     
-    for img_file in CURRENT_DIR.glob("*.img"):
+    for img_path in _device_context.iter_extracted():
+        img_name = os.path.basename(img_path)
         try:
-            img_file.unlink()
-            deleted_files.append(img_file.name)
-            print(f"  ✓ 삭제됨: {img_file.name}")
+            os.remove(img_path)
+            deleted_files.append(img_name)
+            print(f"  ✓ 삭제됨: {img_name}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            print(f"  ✗ 삭제 실패: {img_file.name} - {e}")
+            print(f"  ✗ 삭제 실패: {img_name} - {e}")
+    _device_context.clear_extracted()
     
     # 2. output_folder 삭제
     output_folder = _device_context.get_output_folder()
@@ -66,12 +80,10 @@ def _cleanup_temp_files_on_error() -> None:
         print(f"[정보] 총 {len(deleted_files)}개 파일 정리 완료")
 
 
-def check_edl_connection() -> bool:
+def check_edl_connection(loader: Optional[str] = None) -> bool:
     """EDL 연결 상태 확인"""
-    from core.logger import info, log_validation
-    
     info("EDL 연결 상태 확인 시작")
-    loader_file = _device_context.get_loader()
+    loader_file = loader if loader is not None else _device_context.get_loader()
     if not loader_file:
         log_validation("EDL 로더 파일", False, "로더 파일 미설정")
         print(f"[오류] {ErrorMessages.EDL_LOADER_NOT_SET}")
@@ -88,6 +100,70 @@ def check_edl_connection() -> bool:
     return result
 
 
+# 폴링 중 printgpt 1회 실행 최대 제한 시간 (초)
+_EDL_PROBE_TIMEOUT = 30
+
+
+def _probe_edl_ready(loader: str, timeout: float = _EDL_PROBE_TIMEOUT) -> bool:
+    """EDL 연결 조용히 확인 (폴링용)
+    
+    재부팅 중 실패는 정상 상황이므로 콘솔 출력/명령 로그 없이 결과만 반환합니다.
+    
+    Args:
+        timeout: printgpt 실행 제한 시간 (초과 시 미연결로 처리)
+    """
+    try:
+        process = subprocess.run(
+            [EDL_NG_EXE, "--loader", loader, "printgpt"],
+            capture_output=True, text=True, encoding='utf-8', errors='ignore',
+            timeout=timeout
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return process.returncode == 0 and "GPT Header LUN" in process.stdout
+
+
+def poll_until_edl_ready(loader: Optional[str], max_wait: float,
+                         initial: float = 0.3, factor: float = 1.6) -> bool:
+    """EDL 모드 진입 완료까지 폴링 (고정 대기 대체)
+    
+    간격을 initial부터 factor배씩 늘리며(최대 1.5초) 연결을 확인하고,
+    연결되는 즉시 반환합니다. 로그는 종료 시 1줄만 남깁니다.
+    
+    Returns:
+        max_wait 안에 연결되면 True, 시간 초과 시 False
+    """
+    if loader is None:
+        loader = _device_context.get_loader()
+    if not loader:
+        return False
+    
+    start = time.monotonic()
+    deadline = start + max_wait
+    interval = initial
+    attempts = 0
+    ready = False
+    
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(interval, remaining))
+        # 확인 1회가 남은 대기 시간을 넘기지 않도록 제한
+        probe_budget = min(deadline - time.monotonic(), _EDL_PROBE_TIMEOUT)
+        if probe_budget <= 0:
+            break
+        attempts += 1
+        if _probe_edl_ready(loader, timeout=probe_budget):
+            ready = True
+            break
+        interval = min(interval * factor, 1.5)
+    
+    info("EDL 준비 폴링 종료", ready=ready, attempts=attempts,
+         elapsed=round(time.monotonic() - start, 1))
+    return ready
+
+
 def check_adb_device_state() -> str:
     """
     ADB 기기 연결 상태 확인
@@ -196,28 +272,42 @@ def enter_edl_mode(current_step: int, total_steps: int) -> bool:
     run_command([ADB_EXE, "reboot", "edl"], "EDL 모드 진입 명령 전송")
     wait_seconds = TimingConstants.EDL_BOOT_WAIT
     print(f"\n{Colors.WARNING}[정보] {InfoMessages.EDL_WAIT_MESSAGE.format(seconds=wait_seconds)}{Colors.ENDC}")
-    time.sleep(wait_seconds)
+    # 최대 wait_seconds까지 대기하되, 장치가 먼저 준비되면 즉시 진행
+    if not poll_until_edl_ready(_device_context.get_loader(), wait_seconds):
+        print(f"\n[정보] {wait_seconds}초 안에 EDL 연결을 확인하지 못했습니다. 다음 단계에서 연결을 다시 확인합니다.")
     
     return True
 
 
-def wait_for_edl_connection(current_step: int, total_steps: int) -> bool:
+@lru_cache(maxsize=1)
+def _edl_wait_banner() -> str:
+    """EDL 연결 대기 배너 (최초 1회 생성 후 재사용)"""
+    return (
+        "\n" + "="*50 + "\n"
+        "[ 1단계 - 2 ] EDL 모드 연결 상태를 확인합니다.\n"
+        " * 태블릿 화면이 꺼지고 PC가 장치를 인식할 때까지 기다리십시오.\n"
+        + "="*50 + "\n"
+        f"{Colors.WARNING}{Colors.BOLD}{InfoMessages.WARNING_DO_NOT_DISCONNECT}{Colors.ENDC}\n"
+        + "="*50 + "\n\n"
+    )
+
+
+def wait_for_edl_connection(current_step: int, total_steps: int, loader: Optional[str] = None) -> bool:
     """EDL 모드 연결 대기"""
+    if loader is None:
+        loader = _device_context.get_loader()
+    
     while True:
         clear_screen()
         
         update_sub_task(4, 'in_progress')
         global_print_progress(current_step, total_steps, "STEP 1")
         
-        print("\n" + "="*50)
-        print("[ 1단계 - 2 ] EDL 모드 연결 상태를 확인합니다.")
-        print(" * 태블릿 화면이 꺼지고 PC가 장치를 인식할 때까지 기다리십시오.")
-        print("="*50)
-        print(f"{Colors.WARNING}{Colors.BOLD}{InfoMessages.WARNING_DO_NOT_DISCONNECT}{Colors.ENDC}")
-        print("="*50 + "\n")
+        sys.stdout.write(_edl_wait_banner())
+        sys.stdout.flush()
         
         is_success, output, _ = run_command(
-            [EDL_NG_EXE, "--loader", _device_context.get_loader(), "printgpt"],
+            [EDL_NG_EXE, "--loader", loader, "printgpt"],
             "EDL 모드 연결 확인"
         )
         
@@ -251,8 +341,8 @@ def reboot_to_edl(current_step: int, total_steps: int) -> Tuple[bool, Optional[s
     update_sub_task(3, 'done')
     global_print_progress(current_step, total_steps, "STEP 1")
     
-    # 3. EDL 연결 대기
-    if not wait_for_edl_connection(current_step, total_steps):
+    # 3. EDL 연결 대기 (로더는 모델 확인 단계에서 설정됨)
+    if not wait_for_edl_connection(current_step, total_steps, _device_context.get_loader()):
         return False, None, None
     
     current_step += 1
@@ -262,83 +352,94 @@ def reboot_to_edl(current_step: int, total_steps: int) -> Tuple[bool, Optional[s
     return True, slot_suffix, target_model_number
 
 
-def extract_partition(partition_name: str, slot_suffix: str, output_dir: Optional[str] = None) -> Optional[str]:
-    """파티션 추출"""
-    from core.logger import info, log_extraction
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """파일 stat 반환 (없으면 None) - 존재 확인과 크기 조회를 syscall 1회로 처리"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _cleanup_failed_extract(output_filepath: str, file_exists: bool) -> None:
+    """추출 실패 시 불완전한 파일과 출력 폴더 삭제"""
+    if file_exists:
+        try:
+            os.remove(output_filepath)
+            print(f"[정보] 불완전한 파일 '{output_filepath}'을(를) 삭제했습니다.")
+        except Exception as e:
+            print(f"[경고] 파일 삭제 실패: {e}")
+            log_error(f"파일 삭제 실패: {output_filepath}", exception=e, context="STEP 1 - 파티션 추출")
     
+    output_folder = _device_context.get_output_folder()
+    if output_folder and os.path.exists(output_folder):
+        try:
+            shutil.rmtree(output_folder)
+            print(f"[정보] 불완전한 폴더 '{output_folder}'을(를) 삭제했습니다.")
+        except Exception as e:
+            print(f"[경고] 폴더 삭제 실패: {e}")
+            log_error(f"폴더 삭제 실패: {output_folder}", exception=e, context="STEP 1 - 파티션 추출")
+
+
+def _partition_target(partition_name: str, slot_suffix: str,
+                      output_dir: Optional[str] = None) -> Tuple[str, str]:
+    """읽을 파티션 이름과 출력 파일 경로 반환"""
     if partition_name in ["persist", "devinfo", "keystore"]:
         partition_to_read = partition_name
-        base_output_filename = f"{partition_name}.img"
     else:
         partition_to_read = f"{partition_name}{slot_suffix}"
-        base_output_filename = f"{partition_to_read}.img"
     
+    base_output_filename = f"{partition_to_read}.img"
     if output_dir:
-        output_filepath = os.path.join(output_dir, base_output_filename)
-    else:
-        output_filepath = base_output_filename
+        return partition_to_read, os.path.join(output_dir, base_output_filename)
+    return partition_to_read, base_output_filename
+
+
+def extract_partition(partition_name: str, slot_suffix: str, output_dir: Optional[str] = None,
+                      loader: Optional[str] = None) -> Optional[str]:
+    """파티션 추출
+    
+    Args:
+        loader: EDL 로더 경로. None이면 DeviceContext에서 조회
+    """
+    if loader is None:
+        loader = _device_context.get_loader()
+    
+    partition_to_read, output_filepath = _partition_target(partition_name, slot_suffix, output_dir)
     
     info(f"파티션 추출 시작", partition=partition_name, slot=slot_suffix, target=partition_to_read, output=output_filepath)
     
-    command = [EDL_NG_EXE, "--loader", _device_context.get_loader(), "read-part", partition_to_read, output_filepath]
+    command = [EDL_NG_EXE, "--loader", loader, "read-part", partition_to_read, output_filepath]
     step_description = f"'{partition_to_read}' 파티션 추출"
     
-    if os.path.exists(output_filepath):
+    if _stat_or_none(output_filepath) is not None:
         print(f"[경고] '{output_filepath}' 파일이 이미 존재합니다. 덮어씁니다.")
     
-    # EDL 기기가 이전 작업을 완료하고 다음 명령을 받을 준비를 하도록 1초 대기
+    # EDL 기기가 이전 작업을 완료하고 다음 명령을 받을 준비를 하도록 잠시 대기
     time.sleep(0.5)
     
     success, error_output, _ = run_command(command, step_description)
     
+    post_stat = _stat_or_none(output_filepath)
+    
     # 추출 결과 로깅
-    if success and os.path.exists(output_filepath):
-        file_size = os.path.getsize(output_filepath)
-        log_extraction(partition_to_read, True, {"size_bytes": file_size, "output": output_filepath})
+    if success and post_stat is not None:
+        _device_context.register_extracted(output_filepath)
+        log_extraction(partition_to_read, True, {"size_bytes": post_stat.st_size, "output": output_filepath})
     else:
         log_extraction(partition_to_read, False, {"error": error_output[:200] if error_output else "파일 생성 실패"})
     
-    if not success or not os.path.exists(output_filepath):
+    if not success or post_stat is None:
         # GPT 파싱 에러 확인 (최우선)
         if is_gpt_parsing_error(error_output):
-            if os.path.exists(output_filepath):
-                try:
-                    os.remove(output_filepath)
-                    print(f"[정보] 불완전한 파일 '{output_filepath}'을(를) 삭제했습니다.")
-                except Exception as e:
-                    print(f"[경고] 파일 삭제 실패: {e}")
-                    log_error(f"파일 삭제 실패: {output_filepath}", exception=e, context="STEP 1 - 파티션 추출")
+            _cleanup_failed_extract(output_filepath, post_stat is not None)
             
-            output_folder = _device_context.get_output_folder()
-            if output_folder and os.path.exists(output_folder):
-                try:
-                    shutil.rmtree(output_folder)
-                    print(f"[정보] 불완전한 폴더 '{output_folder}'을(를) 삭제했습니다.")
-                except Exception as e:
-                    print(f"[경고] 폴더 삭제 실패: {e}")
-                    log_error(f"폴더 삭제 실패: {output_folder}", exception=e, context="STEP 1 - 파티션 추출")
-            
-            # GPT 파싱 에러 처리 (자동 재부팅 시도)
+            # GPT 파싱 에러 처리 (자동 재부팅 시도) - 항상 SystemExit/EDLConnectionError 발생
             handle_gpt_parsing_error()
+            return None
         
         # EDL 연결 끊김 확인
         if is_edl_disconnection_error(error_output):
-            if os.path.exists(output_filepath):
-                try:
-                    os.remove(output_filepath)
-                    print(f"[정보] 불완전한 파일 '{output_filepath}'을(를) 삭제했습니다.")
-                except Exception as e:
-                    print(f"[경고] 파일 삭제 실패: {e}")
-                    log_error(f"파일 삭제 실패: {output_filepath}", exception=e, context="STEP 1 - 파티션 추출")
-            
-            output_folder = _device_context.get_output_folder()
-            if output_folder and os.path.exists(output_folder):
-                try:
-                    shutil.rmtree(output_folder)
-                    print(f"[정보] 불완전한 폴더 '{output_folder}'을(를) 삭제했습니다.")
-                except Exception as e:
-                    print(f"[경고] 폴더 삭제 실패: {e}")
-                    log_error(f"폴더 삭제 실패: {output_folder}", exception=e, context="STEP 1 - 파티션 추출")
+            _cleanup_failed_extract(output_filepath, post_stat is not None)
             
             print(f"\n{Colors.FAIL}{'=' * 60}{Colors.ENDC}")
             print(f"{Colors.FAIL}[오류] {ErrorMessages.EDL_DISCONNECT}{Colors.ENDC}")
@@ -361,7 +462,8 @@ def extract_partition(partition_name: str, slot_suffix: str, output_dir: Optiona
     return output_filepath
 
 
-def check_vendor_boot_region(slot_suffix: str) -> Optional[Tuple[str, str]]:
+def check_vendor_boot_region(slot_suffix: str, loader: Optional[str] = None,
+                             output_dir: Optional[str] = None) -> Optional[Tuple[str, str]]:
     """vendor_boot 지역 코드 확인"""
     print("\n" + "="*50)
     print(f"[ 2단계 ] vendor_boot{slot_suffix} 지역 코드(Region Code) 확인 (Hex)")
@@ -369,15 +471,15 @@ def check_vendor_boot_region(slot_suffix: str) -> Optional[Tuple[str, str]]:
     print(f"{Colors.WARNING}{Colors.BOLD}{InfoMessages.WARNING_EDL_COMMUNICATION}{Colors.ENDC}")
     print("="*50 + "\n")
     
-    filepath = extract_partition("vendor_boot", slot_suffix)
+    filepath = extract_partition("vendor_boot", slot_suffix, output_dir, loader=loader)
     if not filepath:
         return None
     
     try:
+        # 전체를 메모리로 읽지 않고 mmap으로 스캔 (파일 이동 전에 닫힘)
         with open(filepath, 'rb') as f:
-            data = f.read()
-        
-        region_code = validate_region_code(data)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                region_code = validate_region_code(mm)
         
         # 지역 코드에 따라 메시지 출력
         if region_code in ['IPRC', 'PRC']:
@@ -403,52 +505,49 @@ def check_vendor_boot_region(slot_suffix: str) -> Optional[Tuple[str, str]]:
         return None
 
 
-def check_vbmeta_props(slot_suffix: str) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
-    """vbmeta 국가 코드, 모델, 롬 버전 확인"""
+def check_vbmeta_props(slot_suffix: str, loader: Optional[str] = None,
+                       output_dir: Optional[str] = None
+                       ) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """vbmeta 국가 코드, 모델, 롬 버전 확인
+    
+    Returns:
+        (모델, 국가 코드, 롬 버전, vbmeta 파일 경로, vbmeta 롤백 인덱스) 튜플
+        롤백 인덱스는 같은 avbtool 출력에서 함께 파싱 (없으면 "NOT_FOUND")
+    """
     print("\n" + "="*50)
     print(f"[ 3단계 ] vbmeta{slot_suffix} 국가 코드, 모델, 롬 버전 확인")
     print("="*50)
     print(f"{Colors.WARNING}{Colors.BOLD}{InfoMessages.WARNING_EDL_COMMUNICATION}{Colors.ENDC}")
     print("="*50 + "\n")
     
-    filepath = extract_partition("vbmeta", slot_suffix)
+    filepath = extract_partition("vbmeta", slot_suffix, output_dir, loader=loader)
     if not filepath:
-        return None, None, None, None
+        return None, None, None, None, None
     
-    command = ["python", AVBTOOL_PY, "info_image", "--image", filepath]
-    success, output, _ = run_command(command, f"avbtool.py로 '{filepath}' 분석")
+    success, output = cached_avbtool_info(filepath)
     
     if not success:
-        return None, None, None, None
-    
-    fingerprint_regex = re.compile(
-        r"'[^/]+/([^/]+)/[^:]+:[^/]+/(([^:]+_(PRC|ROW))):user/release-keys'"
-    )
+        return None, None, None, None, None
     
     found_models = set()
     found_rom_versions = set()
     found_country_codes = set()
-    fingerprint_lines_count = 0
     matched_lines_count = 0
     
-    for line in output.splitlines():
-        if line.strip().startswith("Prop:") and "fingerprint" in line.strip():
-            fingerprint_lines_count += 1
-            match = fingerprint_regex.search(line)
-            
-            if match:
-                matched_lines_count += 1
-                found_models.add(match.group(1))
-                found_rom_versions.add(match.group(2))
-                found_country_codes.add(match.group(4))
+    for match in _FINGERPRINT_RE.finditer(output):
+        matched_lines_count += 1
+        found_models.add(match.group(1))
+        found_rom_versions.add(match.group(2))
+        found_country_codes.add(match.group(4))
     
-    if fingerprint_lines_count == 0:
+    # 매칭이 없을 때만 fingerprint 라인 존재 여부를 따로 확인
+    if matched_lines_count == 0 and not _FINGERPRINT_PROP_RE.search(output):
         show_popup(
             TitleMessages.ERROR,
             ErrorMessages.VBMETA_FINGERPRINT_NOT_FOUND,
             icon=UIConstants.ICON_ERROR
         )
-        return None, None, None, None
+        return None, None, None, None, None
     
     if matched_lines_count == 0:
         show_popup(
@@ -456,7 +555,7 @@ def check_vbmeta_props(slot_suffix: str) -> Tuple[Optional[str], Optional[str],
             ErrorMessages.VBMETA_FORMAT_INVALID,
             icon=UIConstants.ICON_ERROR
         )
-        return None, None, None, None
+        return None, None, None, None, None
     
     prc_found = "PRC" in found_country_codes
     row_found = "ROW" in found_country_codes
@@ -472,27 +571,29 @@ def check_vbmeta_props(slot_suffix: str) -> Tuple[Optional[str], Optional[str],
             ErrorMessages.VBMETA_COUNTRY_CODE_MIXED,
             icon=UIConstants.ICON_ERROR
         )
-        return None, None, None, None
+        return None, None, None, None, None
     else:
         show_popup(
             TitleMessages.ERROR,
             ErrorMessages.VBMETA_COUNTRY_CODE_NOT_FOUND,
             icon=UIConstants.ICON_ERROR
         )
-        return None, None, None, None
+        return None, None, None, None, None
     
     model = list(found_models)[0]
     rom_version = list(found_rom_versions)[0]
     
     print(f"[성공] 모델: {model}, 국가 코드: {country_code}")
     print(f"[성공] 롬 버전: {rom_version}")
-    return model, country_code, rom_version, filepath
+    
+    rollback_match = _ROLLBACK_RE.search(output)
+    vbmeta_rb = rollback_match.group(1) if rollback_match else "NOT_FOUND"
+    return model, country_code, rom_version, filepath, vbmeta_rb
 
 
-def get_rollback_index(partition_name: str, slot_suffix: str, output_dir: str) -> str:
+def get_rollback_index(partition_name: str, slot_suffix: str, output_dir: str,
+                       loader: Optional[str] = None) -> str:
     """롤백 인덱스 확인"""
-    from core.logger import info, log_validation
-    
     partition_name_with_slot = f"{partition_name}{slot_suffix}"
     
     info(f"롤백 인덱스 확인 시작", partition=partition_name, slot=slot_suffix, target=partition_name_with_slot)
@@ -507,22 +608,20 @@ def get_rollback_index(partition_name: str, slot_suffix: str, output_dir: str) -
     expected_filename = f"{partition_name_with_slot}.img"
     expected_filepath = os.path.join(output_dir, expected_filename)
     
-    if os.path.exists(expected_filepath):
+    if _stat_or_none(expected_filepath) is not None:
         print(f"[정보] '{expected_filename}' 파일이 이미 존재합니다. 재사용합니다.")
         filepath = expected_filepath
     else:
-        filepath = extract_partition(partition_name, slot_suffix, output_dir)
+        filepath = extract_partition(partition_name, slot_suffix, output_dir, loader=loader)
         if not filepath:
             return "EXTRACTION_FAILURE"
     
-    command = ["python", AVBTOOL_PY, "info_image", "--image", filepath]
-    success, output, _ = run_command(command, f"avbtool.py로 '{filepath}' 분석")
+    success, output = cached_avbtool_info(filepath)
     
     if not success:
         return "AVBTOOL_FAILURE"
     
-    rollback_regex = re.compile(r"Rollback Index:\s*(\d+)")
-    match = rollback_regex.search(output)
+    match = _ROLLBACK_RE.search(output)
     
     if match:
         index = match.group(1)
@@ -563,8 +662,7 @@ def save_device_info_to_file(region_code: str, model: str, country_code: str, ro
     )
     
     try:
-        with open(output_filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        Path(output_filepath).write_text(content, encoding='utf-8')
         print(f"[성공] 장치 정보를 '{output_filepath}' 파일에 저장했습니다.")
         return True
     except Exception as e:
@@ -572,12 +670,12 @@ def save_device_info_to_file(region_code: str, model: str, country_code: str, ro
         return False
 
 
-def reboot_device_from_edl() -> bool:
+def reboot_device_from_edl(loader: Optional[str] = None) -> bool:
     """EDL 모드에서 장치 재부팅"""
     print("\n" + "="*50)
     print("[ 7단계 ] 장치 재부팅")
     print("="*50)
-    loader_file = _device_context.get_loader()
+    loader_file = loader if loader is not None else _device_context.get_loader()
     if loader_file:
         run_command([EDL_NG_EXE, "--loader", loader_file, "reset"], "장치 재부팅")
         return True
@@ -591,25 +689,25 @@ def _check_vendor_boot_and_vbmeta(
     slot_suffix: str,
     target_model_number: str,
     step1_current_step: int,
-    step1_total_steps: int
-) -> Tuple[Dict[str, str], Dict[str, str], int]:
-    """Task 5-6: vendor_boot과 vbmeta 확인"""
+    step1_total_steps: int,
+    loader: str,
+    output_dir_path: str
+) -> Tuple[Dict[str, str], int]:
+    """Task 5-6: vendor_boot과 vbmeta 확인 (출력 폴더에 바로 추출)"""
     device_info = {
         "region_code": "N/A", "model": "N/A", "country_code": "N/A",
-        "rom_version": "N/A", "vbmeta_system_rb": "N/A", "boot_rb": "N/A",
+        "rom_version": "N/A", "vbmeta_rb": "N/A", "vbmeta_system_rb": "N/A", "boot_rb": "N/A",
         "current_slot": slot_suffix
     }
-    temp_files_to_move = {}
     
     # Task 5: vendor_boot 확인
     update_sub_task(5, 'in_progress')
     global_print_progress(step1_current_step, step1_total_steps, "STEP 1")
-    result = check_vendor_boot_region(slot_suffix)
+    result = check_vendor_boot_region(slot_suffix, loader, output_dir_path)
     if result is None:
         raise Exception("vendor_boot 지역 코드 확인 실패 또는 NG")
-    region_code, vendor_boot_temp_path = result
+    region_code, _ = result
     device_info["region_code"] = region_code
-    temp_files_to_move[os.path.basename(vendor_boot_temp_path)] = vendor_boot_temp_path
     step1_current_step += 1
     update_sub_task(5, 'done')
     global_print_progress(step1_current_step, step1_total_steps, "STEP 1")
@@ -617,14 +715,14 @@ def _check_vendor_boot_and_vbmeta(
     # Task 6: vbmeta 확인
     update_sub_task(6, 'in_progress')
     global_print_progress(step1_current_step, step1_total_steps, "STEP 1")
-    result = check_vbmeta_props(slot_suffix)
-    model, country_code, rom_version, vbmeta_temp_path = result
+    result = check_vbmeta_props(slot_suffix, loader, output_dir_path)
+    model, country_code, rom_version, _, vbmeta_rb = result
     if model is None:
         raise Exception("vbmeta 확인 실패")
     device_info["model"] = model
     device_info["country_code"] = country_code
     device_info["rom_version"] = rom_version
-    temp_files_to_move[os.path.basename(vbmeta_temp_path)] = vbmeta_temp_path
+    device_info["vbmeta_rb"] = vbmeta_rb
     step1_current_step += 1
     update_sub_task(6, 'done')
     global_print_progress(step1_current_step, step1_total_steps, "STEP 1")
@@ -641,41 +739,26 @@ def _check_vendor_boot_and_vbmeta(
         )
         raise Exception("모델 불일치")
     
-    return device_info, temp_files_to_move, step1_current_step
+    return device_info, step1_current_step
 
 
 def _extract_rollback_and_additional_partitions(slot_suffix: str, output_dir_path: str, 
-                                                 temp_files_to_move: Dict[str, str],
                                                  device_info: Dict[str, str],
-                                                 step1_current_step: int, step1_total_steps: int) -> int:
+                                                 step1_current_step: int, step1_total_steps: int,
+                                                 loader: str) -> int:
     """Task 7: 롤백 인덱스 확인 및 추가 파티션 추출"""
     update_sub_task(7, 'in_progress')
     global_print_progress(step1_current_step, step1_total_steps, "STEP 1")
     
-    # 임시 파일 이동
-    print("\n[정보] 임시 추출 파일 이동 중...")
-    for dest_filename, src_path in temp_files_to_move.items():
-        if src_path and os.path.exists(src_path):
-            dest_path = os.path.join(output_dir_path, dest_filename)
-            try:
-                shutil.move(src_path, dest_path)
-                print(f"  - {src_path} -> {dest_path} 이동 완료.")
-            except Exception as e:
-                error_msg = f"{src_path} 이동 실패: {e}"
-                print(f"  - [오류] {error_msg}")
-                log_error(error_msg, exception=e, context="STEP 1 - 파일 이동")
-        else:
-            print(f"  - [경고] {dest_filename}의 원본({src_path})을 찾을 수 없어 이동 생략.")
-    
     # 롤백 인덱스 추출
-    device_info["vbmeta_system_rb"] = get_rollback_index("vbmeta_system", slot_suffix, output_dir_path)
-    device_info["boot_rb"] = get_rollback_index("boot", slot_suffix, output_dir_path)
+    device_info["vbmeta_system_rb"] = get_rollback_index("vbmeta_system", slot_suffix, output_dir_path, loader)
+    device_info["boot_rb"] = get_rollback_index("boot", slot_suffix, output_dir_path, loader)
     
     # 추가 파티션 추출
     print("\n[정보] 추가 파티션 추출 중...")
-    extract_partition("persist", slot_suffix, output_dir_path)
-    extract_partition("devinfo", slot_suffix, output_dir_path)
-    extract_partition("keystore", slot_suffix, output_dir_path)
+    extract_partition("persist", slot_suffix, output_dir_path, loader)
+    extract_partition("devinfo", slot_suffix, output_dir_path, loader)
+    extract_partition("keystore", slot_suffix, output_dir_path, loader)
     
     step1_current_step += 1
     update_sub_task(7, 'done')
@@ -753,28 +836,32 @@ def run_step_1() -> Tuple[Optional[str], Optional[Dict[str, str]], Optional[str]
     
     step1_current_step = 5
     output_dir_path = None
+    # STEP 1 동안 로더는 변하지 않으므로 한 번만 조회
+    loader = _device_context.get_loader()
     
     try:
-        # Task 5-6: vendor_boot과 vbmeta 확인
-        device_info, temp_files_to_move, step1_current_step = _check_vendor_boot_and_vbmeta(
-            slot_suffix, target_model_number, step1_current_step, step1_total_steps
-        )
-        
-        # 출력 폴더 생성
+        # 출력 폴더 생성 (모든 파티션을 이 폴더로 바로 추출)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_folder_name = f"{timestamp}_Backup"
         ROMFILE_PATCH_BACKUP_DIR.mkdir(parents=True, exist_ok=True)
         output_dir_path = str(ROMFILE_PATCH_BACKUP_DIR / output_folder_name)
         _device_context.set_output_folder(Path(output_dir_path))
+        # 오류 시 정리 대상은 이번 실행에서 추출한 파일만 (이전 실행/백업 기능의 파일 보호)
+        _device_context.clear_extracted()
         
         print(f"\n[정보] 출력 폴더 생성 시도: {output_dir_path}")
         os.makedirs(output_dir_path, exist_ok=True)
         print(f"[성공] 출력 폴더 준비 완료.")
         
+        # Task 5-6: vendor_boot과 vbmeta 확인
+        device_info, step1_current_step = _check_vendor_boot_and_vbmeta(
+            slot_suffix, target_model_number, step1_current_step, step1_total_steps, loader, output_dir_path
+        )
+        
         # Task 7: 롤백 인덱스 확인 및 추가 파티션 추출
         step1_current_step = _extract_rollback_and_additional_partitions(
-            slot_suffix, output_dir_path, temp_files_to_move, device_info, 
-            step1_current_step, step1_total_steps
+            slot_suffix, output_dir_path, device_info, 
+            step1_current_step, step1_total_steps, loader
         )
         
         # Task 8: 기기 정보 저장 및 검증
@@ -782,6 +869,8 @@ def run_step_1() -> Tuple[Optional[str], Optional[Dict[str, str]], Optional[str]
             device_info, output_dir_path, timestamp, step1_current_step, step1_total_steps
         )
         
+        # 성공한 결과물은 이후 정리 대상에서 제외
+        _device_context.clear_extracted()
         return model, device_rollback_indices, output_dir_path
     
     except EDLConnectionError as e:
@@ -804,7 +893,7 @@ def run_step_1() -> Tuple[Optional[str], Optional[Dict[str, str]], Optional[str]
         update_sub_task(9, 'in_progress')
         global_print_progress(step1_current_step, step1_total_steps, "STEP 1")
         try:
-            reboot_device_from_edl()
+            reboot_device_from_edl(loader)
         except EDLConnectionError:
             print("[정보] EDL 연결이 끊겨 재부팅 명령을 건너뜁니다.")
         except Exception as e:
@@ -1,33 +1,102 @@
 """STEP 2: 롬파일 분석 및 백업 - 실제 코드"""
 # 표준 라이브러리
+import mmap
 import os
 import re
-import shutil
+import stat
 import sys
+import threading
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 # 로컬 모듈
 from src.config import Colors
-from src.config import AVBTOOL_PY, ROM_DIR_STR
-from src.config import UIConstants, FolderConstants, FileConstants, ValidationConstants, HEX_PRC, HEX_IPRC, HEX_ROW, HEX_IROW
+from src.config import ROM_DIR_STR
+from src.config import UIConstants, FolderConstants, FileConstants, ValidationConstants
 from src.config import ErrorMessages, InfoMessages, TitleMessages
 from src.progress import init_step_progress, update_sub_task, global_print_progress, global_end_progress
 from src.context import CopyProgressTracker
 from src.logger import log_error
 from utils.ui import show_popup, show_popup_yesno
-from utils.command import run_command
-from utils.file_operations import remove_readonly_and_delete, get_total_files, copy_with_progress
+from utils.file_operations import remove_readonly_and_delete, copy_tree_parallel, print_copy_progress
+from utils.avb_tools import cached_avbtool_info, read_avb_rollback_index
 from utils.region_check import check_region_patterns, check_region_in_image
 
 # 모듈 레벨 복사 진행률 추적기
 _copy_tracker = CopyProgressTracker()
 
+# avbtool 출력 파싱용 정규식
+# fingerprint Prop 라인에서 값만 추출 (형식: Prop: ... -> 'value')
+_FP_LINE_RE = re.compile(r"Prop:\s+com\.android\.build[^\n]*fingerprint[^\n]*?->\s*'([^'\n]+)'")
+_ROLLBACK_RE = re.compile(r"Rollback Index:\s+(\d+)")
+
 
 # Helper Functions for run_step_2 (리팩토링)
 
+# 롤백 시 치워 둔 이전 패치 폴더 표시 (백그라운드 삭제 중, 롬 폴더 목록에서 제외)
+_DELETING_MARK = ".deleting."
+
+# 백그라운드로 복사 중인 _RAW 백업 폴더 표시 (완료 후 _RAW 이름으로 변경, 롬 폴더 목록에서 제외)
+_PARTIAL_MARK = ".partial."
+
+# 위 표시가 붙은 임시 폴더 이름 (<이름>.deleting.<pid>, <이름>_RAW.partial.<pid>), 그룹 1=pid
+_STAGED_FOLDER_RE = re.compile(
+    rf"^.+(?:{re.escape(_DELETING_MARK)}|{re.escape(FolderConstants.RAW_SUFFIX + _PARTIAL_MARK)})(\d+)$"
+)
+
+
+def _is_pid_alive(pid: int) -> bool:
+    """프로세스가 아직 실행 중인지 확인 (확인할 수 없으면 실행 중으로 간주)"""
+    if pid <= 0:
+        return False
+    if sys.platform == 'win32':
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        # PROCESS_QUERY_LIMITED_INFORMATION
+        handle = kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _delete_in_background(path: str) -> None:
+    """폴더를 백그라운드 스레드에서 삭제 (실패는 로그만 남김)"""
+    def _worker() -> None:
+        try:
+            remove_readonly_and_delete(Path(path))
+        except Exception as e:
+            log_error(f"백그라운드 폴더 삭제 실패: {path}", exception=e, context="STEP 2 - 롤백")
+    
+    threading.Thread(target=_worker, daemon=True).start()
+
+
+def _avbtool_info(image_path: str) -> Tuple[bool, str, str]:
+    """avbtool info_image 실행 (프로세스 내 호출, 결과 캐시)
+    
+    Returns:
+        (성공 여부, stdout, stderr) 튜플 (실패 상세는 콘솔/로그에 기록됨)
+    """
+    success, stdout = cached_avbtool_info(image_path)
+    stderr = "" if success else "avbtool info_image 실패 (상세 내용은 로그 참조)"
+    return success, stdout, stderr
+
 
 def _check_rom_folders() -> Tuple[Optional[str], Optional[str]]:
     """롬 폴더 확인 및 _RAW 백업 처리
@@ -36,7 +105,9 @@ def _check_rom_folders() -> Tuple[Optional[str], Optional[str]]:
         (rom_path, rom_name) 또는 (None, None) if error
     """
     try:
-        items = os.listdir(ROM_DIR_STR)
+        # scandir의 DirEntry 타입 정보를 사용해 항목별 추가 stat 없이 폴더만 수집
+        with os.scandir(ROM_DIR_STR) as it:
+            rom_folders = [entry.name for entry in it if entry.is_dir()]
     except FileNotFoundError:
         show_popup(
             TitleMessages.ERROR,
@@ -56,7 +127,16 @@ def _check_rom_folders() -> Tuple[Optional[str], Optional[str]]:
         input("\nEnter 키를 누르면 메인 메뉴로 돌아갑니다...")
         return None, None
     
-    rom_folders = [item for item in items if os.path.isdir(os.path.join(ROM_DIR_STR, item))]
+    # 이 프로그램이 만든 임시 폴더(삭제 대기/복사 중)는 목록에서 제외하고,
+    # 만든 프로세스가 이미 종료된 경우에만 삭제 (실행 중인 다른 인스턴스의 작업은 유지)
+    for folder_name in list(rom_folders):
+        match = _STAGED_FOLDER_RE.match(folder_name)
+        if not match:
+            continue
+        rom_folders.remove(folder_name)
+        owner_pid = int(match.group(1))
+        if owner_pid != os.getpid() and not _is_pid_alive(owner_pid):
+            _delete_in_background(os.path.join(ROM_DIR_STR, folder_name))
     
     # _RAW 백업 상태 확인
     print(f"\n[정보] 기존 롬파일 백업(_RAW) 상태 확인 중...")
@@ -167,7 +247,10 @@ def _handle_raw_backup_rollback(raw_pair: Tuple[str, str]) -> bool:
     if user_choice == 6:  # YES
         print("[정보] 사용자가 'YES'를 선택했습니다. 롤백을 진행합니다.")
         
-        max_retries = 3
+        # 이전 패치 폴더는 이름만 바꿔 치운 뒤 백그라운드에서 삭제
+        staged_path = f"{rom_path_to_check}{_DELETING_MARK}{os.getpid()}"
+        # 탐색기 폴더 잠금 재시도는 Windows에서만 의미가 있음
+        max_retries = 3 if sys.platform == 'win32' else 1
         for retry_count in range(max_retries):
             try:
                 if retry_count > 0:
@@ -175,11 +258,13 @@ def _handle_raw_backup_rollback(raw_pair: Tuple[str, str]) -> bool:
                     print(f"{Colors.OKCYAN}Windows 탐색기에서 해당 폴더를 닫고 Enter를 누르십시오...{Colors.ENDC}")
                     input()
                 
-                print(f"  - 삭제 시도: {rom_path_to_check}")
-                remove_readonly_and_delete(Path(rom_path_to_check))
+                if os.path.exists(rom_path_to_check):
+                    print(f"  - 삭제 대기 폴더로 이동: {rom_path_to_check}")
+                    os.rename(rom_path_to_check, staged_path)
                 print(f"  - 이름 변경: {raw_name_to_check} → {rom_name_to_check}")
                 os.rename(raw_path_to_check, rom_path_to_check)
-                print(f"{Colors.OKGREEN}[성공] 롤백이 완료되었습니다!{Colors.ENDC}")
+                _delete_in_background(staged_path)
+                print(f"{Colors.OKGREEN}[성공] 롤백이 완료되었습니다! (이전 패치 폴더는 백그라운드에서 삭제){Colors.ENDC}")
                 return True
             except Exception as e:
                 if retry_count < max_retries - 1:
@@ -208,6 +293,14 @@ def _handle_raw_backup_rollback(raw_pair: Tuple[str, str]) -> bool:
         return False
 
 
+def _is_dir(path: str) -> bool:
+    """os.stat 1회로 폴더 여부 확인 (exists + isdir 대체)"""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
 def _find_actual_rom_path(rom_path: str) -> Optional[str]:
     """중첩 폴더 구조 확인 (최대 3단계)
     
@@ -219,14 +312,14 @@ def _find_actual_rom_path(rom_path: str) -> Optional[str]:
     
     for depth in range(max_depth):
         image_path = os.path.join(current_path, FolderConstants.IMAGE_DIR)
-        if os.path.exists(image_path) and os.path.isdir(image_path):
+        if _is_dir(image_path):
             if depth > 0:
                 print(f"{Colors.OKGREEN}  ✓ {depth}단계 중첩 구조 발견: image 폴더 위치 확인{Colors.ENDC}")
             return current_path
         else:
             try:
-                subdirs = [d for d in os.listdir(current_path) 
-                          if os.path.isdir(os.path.join(current_path, d))]
+                with os.scandir(current_path) as it:
+                    subdirs = [entry.name for entry in it if entry.is_dir()]
                 
                 if len(subdirs) == 1:
                     nested_folder = subdirs[0]
@@ -315,9 +408,7 @@ def _analyze_vbmeta_prop(vbmeta_path: str, target_model: str) -> Optional[Tuple[
     
     log_validation("vbmeta.img 존재 여부", True, f"파일 크기: {os.path.getsize(vbmeta_path)} bytes")
     
-    from config.paths import PYTHON_EXE
-    cmd = [PYTHON_EXE, str(AVBTOOL_PY), "info_image", "--image", vbmeta_path]
-    success, stdout, stderr = run_command(cmd, check=False)
+    success, stdout, stderr = _avbtool_info(vbmeta_path)
     
     if not success:
         show_popup("NG", f"vbmeta.img 분석 실패:\n{stderr}",
@@ -326,20 +417,13 @@ def _analyze_vbmeta_prop(vbmeta_path: str, target_model: str) -> Optional[Tuple[
         input("\nEnter 키를 누르면 메인 메뉴로 돌아갑니다...")
         return None
     
-    # fingerprint 파싱
-    fingerprint_lines = []
-    for line in stdout.split('\n'):
-        if 'Prop: com.android.build' in line and 'fingerprint' in line:
-            # 형식: Prop: ... -> 'value'
-            match = re.search(r"-> '(.+?)'", line)
-            if match:
-                fingerprint_lines.append(match.group(1))
+    # fingerprint 파싱 (정보 추출에는 첫 번째만 사용)
+    first_match = _FP_LINE_RE.search(stdout)
     
-    info(f"추출된 fingerprint 개수: {len(fingerprint_lines)}")
-    if fingerprint_lines:
-        info(f"첫 번째 fingerprint: {fingerprint_lines[0]}")
+    if first_match:
+        info(f"첫 번째 fingerprint: {first_match.group(1)}")
     
-    if not fingerprint_lines:
+    if not first_match:
         log_validation("fingerprint 파싱", False, "fingerprint를 찾을 수 없음")
         print(f"\n{Colors.FAIL}[NG] vbmeta Prop에서 fingerprint를 찾을 수 없습니다.{Colors.ENDC}")
         show_popup("NG", "vbmeta Prop에서 fingerprint를 찾을 수 없습니다.",
@@ -348,9 +432,9 @@ def _analyze_vbmeta_prop(vbmeta_path: str, target_model: str) -> Optional[Tuple[
         input("\nEnter 키를 누르면 메인 메뉴로 돌아갑니다...")
         return None
     
-    # PRC 확인 (NG 조건)
-    has_prc = any('PRC' in fp for fp in fingerprint_lines)
-    info(f"PRC 검사 결과: {has_prc}", fingerprints=fingerprint_lines)
+    # PRC 확인 (NG 조건) - 출력 전체에 'PRC'가 없으면 fingerprint 목록을 만들지 않음
+    has_prc = 'PRC' in stdout and any('PRC' in fp for fp in _FP_LINE_RE.findall(stdout))
+    info(f"PRC 검사 결과: {has_prc}")
     
     if has_prc:
         log_validation("국가 코드 (PRC 확인)", False, "PRC 발견 - 중국 롬")
@@ -365,7 +449,7 @@ def _analyze_vbmeta_prop(vbmeta_path: str, target_model: str) -> Optional[Tuple[
     log_validation("국가 코드 (PRC 확인)", True, "PRC 없음 - ROW 롬")
     
     # 정보 추출
-    first_fp = fingerprint_lines[0]
+    first_fp = first_match.group(1)
     parts = first_fp.split('/')
     
     model = parts[1] if len(parts) > 1 else "Unknown"
@@ -421,29 +505,14 @@ def _analyze_vendor_boot_hex(vendor_boot_path: str) -> Optional[str]:
     file_size = os.path.getsize(vendor_boot_path)
     log_validation("vendor_boot.img 존재 여부", True, f"파일 크기: {file_size} bytes")
     
-    # 메모리 최적화: 청크 단위로 읽기 (100MB 파일을 한번에 로드하지 않음)
-    CHUNK_SIZE = 10 * 1024 * 1024  # 10MB
-    found_prc = False
-    found_iprc = False
-    found_row = False
-    found_irow = False
-    
-    with open(vendor_boot_path, 'rb') as f:
-        while True:
-            chunk = f.read(CHUNK_SIZE)
-            if not chunk:
-                break
-            
-            if not found_prc and HEX_PRC in chunk:
-                found_prc = True
-            if not found_iprc and HEX_IPRC in chunk:
-                found_iprc = True
-            if not found_row and HEX_ROW in chunk:
-                found_row = True
-            if not found_irow and HEX_IROW in chunk:
-                found_irow = True
+    # 메모리 최적화: mmap으로 복사 없이 스캔 (청크 경계에 걸친 패턴도 놓치지 않음)
+    found_prc = found_iprc = found_row = found_irow = False
+    if file_size > 0:
+        with open(vendor_boot_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            found_prc, found_iprc, found_row, found_irow = check_region_patterns(mm)
     
-    info("바이너리 데이터 읽기 완료 (청크 방식)", size=file_size)
+    info("바이너리 데이터 읽기 완료 (mmap 방식)", size=file_size)
     
     info(
         "Hex 패턴 검사 결과",
@@ -506,6 +575,8 @@ def _analyze_vendor_boot_hex(vendor_boot_path: str) -> Optional[str]:
 def _extract_rollback_index(image_path: str, image_name: str) -> Optional[str]:
     """이미지에서 롤백 인덱스 추출
     
+    AVB 헤더/푸터에서 직접 읽고, 실패한 경우에만 avbtool 출력을 파싱합니다.
+    
     Returns:
         rollback_index 또는 None if error
     """
@@ -517,9 +588,11 @@ def _extract_rollback_index(image_path: str, image_name: str) -> Optional[str]:
         input("\nEnter 키를 누르면 메인 메뉴로 돌아갑니다...")
         return None
     
-    from config.paths import PYTHON_EXE
-    cmd = [PYTHON_EXE, str(AVBTOOL_PY), "info_image", "--image", image_path]
-    success, stdout, stderr = run_command(cmd, check=False)
+    rollback_index = read_avb_rollback_index(image_path)
+    if rollback_index is not None:
+        return str(rollback_index)
+    
+    success, stdout, stderr = _avbtool_info(image_path)
     
     if not success:
         print(f"\n{Colors.FAIL}[NG] {image_name} 분석 실패: {stderr}{Colors.ENDC}")
@@ -529,7 +602,7 @@ def _extract_rollback_index(image_path: str, image_name: str) -> Optional[str]:
         input("\nEnter 키를 누르면 메인 메뉴로 돌아갑니다...")
         return None
     
-    match = re.search(r"Rollback Index:\s+(\d+)", stdout)
+    match = _ROLLBACK_RE.search(stdout)
     if not match:
         print(f"\n{Colors.FAIL}[NG] {image_name}에서 Rollback Index를 찾을 수 없습니다.{Colors.ENDC}")
         show_popup("NG", f"{image_name}에서 Rollback Index를 찾을 수 없습니다.",
@@ -541,8 +614,38 @@ def _extract_rollback_index(image_path: str, image_name: str) -> Optional[str]:
     return match.group(1)
 
 
-def _create_raw_backup(original_rom_path: str, raw_backup_path: str) -> bool:
-    """_RAW 백업 폴더 생성
+def _start_raw_backup(original_rom_path: str, raw_backup_path: str) -> Tuple[Future, threading.Event, str]:
+    """_RAW 백업 복사를 백그라운드에서 시작
+    
+    검증(작업 2~7)과 동시에 임시 폴더로 복사하고, 작업 8에서 완료를 기다린 뒤
+    _RAW 이름으로 바꿉니다. 중간에 종료되어도 _RAW 쌍으로 오인되지 않도록
+    복사 중에는 _PARTIAL_MARK가 붙은 이름을 사용합니다.
+    
+    Returns:
+        (복사 Future, 취소 이벤트, 임시 폴더 경로) 튜플
+    """
+    staging_path = f"{raw_backup_path}{_PARTIAL_MARK}{os.getpid()}"
+    cancel_event = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=1)
+    # 백업은 롤백 시 이름만 바꿔 복구하므로 파일 내용만 복사, 진행률은 작업 8에서 출력
+    future = executor.submit(
+        copy_tree_parallel, original_rom_path, staging_path, _copy_tracker,
+        preserve_metadata=False, show_progress=False, cancel_event=cancel_event
+    )
+    executor.shutdown(wait=False)
+    return future, cancel_event, staging_path
+
+
+def _cancel_raw_backup(backup_job: Tuple[Future, threading.Event, str]) -> None:
+    """백그라운드 _RAW 백업 중단 (복사가 멈추면 임시 폴더 삭제)"""
+    future, cancel_event, staging_path = backup_job
+    cancel_event.set()
+    future.add_done_callback(lambda _: _delete_in_background(staging_path))
+
+
+def _create_raw_backup(original_rom_path: str, raw_backup_path: str,
+                       backup_job: Tuple[Future, threading.Event, str]) -> bool:
+    """_RAW 백업 폴더 생성 (백그라운드 복사 완료 대기 후 _RAW로 이름 변경)
     
     Returns:
         True if success, False if error
@@ -551,20 +654,16 @@ def _create_raw_backup(original_rom_path: str, raw_backup_path: str) -> bool:
     print(f"  원본: {original_rom_path}")
     print(f"  백업: {raw_backup_path}")
     
+    future, _, staging_path = backup_job
     try:
-        total_files = get_total_files(original_rom_path)
-        _copy_tracker.reset()
-        _copy_tracker.set_total(total_files)
-        
-        def copy_func(src, dst) -> None:
-            """파일 복사 wrapper"""
-            copy_with_progress(src, dst, _copy_tracker)
-        
-        shutil.copytree(
-            original_rom_path,
-            raw_backup_path,
-            copy_function=copy_func
-        )
+        while True:
+            try:
+                future.result(timeout=0.2)
+                break
+            except FuturesTimeoutError:
+                print_copy_progress(_copy_tracker)
+        print_copy_progress(_copy_tracker)
+        os.rename(staging_path, raw_backup_path)
         
         print(f"\n{Colors.OKGREEN}원본 롬파일 백업 완료!{Colors.ENDC}")
         return True
@@ -661,6 +760,12 @@ def run_step_2(target_model_number: str, step1_output_dir: str) -> Tuple[Optiona
         input("\nEnter 키를 누르면 메인 메뉴로 돌아갑니다...")
         return None, None
     
+    # 검증 대상 이미지 경로 (한 번만 생성)
+    vbmeta_path = os.path.join(image_dir, FileConstants.VBMETA)
+    vendor_boot_path = os.path.join(image_dir, FileConstants.VENDOR_BOOT)
+    vbmeta_system_path = os.path.join(image_dir, FileConstants.VBMETA_SYSTEM)
+    boot_path = os.path.join(image_dir, FileConstants.BOOT)
+    
     print(f"{Colors.OKGREEN}[PASS] 롬파일 경로 확인 완료{Colors.ENDC}")
     update_sub_task(0, 'done')
     global_print_progress(1, step2_total_steps, "STEP 2")
@@ -676,82 +781,87 @@ def run_step_2(target_model_number: str, step1_output_dir: str) -> Tuple[Optiona
     update_sub_task(1, 'done')
     global_print_progress(2, step2_total_steps, "STEP 2")
     
-    # [작업 3] vbmeta Prop 분석 (2차 모델 검증)
-    update_sub_task(2, 'in_progress')
-    global_print_progress(2, step2_total_steps, "STEP 2")
-    
-    vbmeta_path = os.path.join(image_dir, "vbmeta.img")
-    vbmeta_result = _analyze_vbmeta_prop(vbmeta_path, target_model_number)
-    if not vbmeta_result:
-        return None, None
-    
-    model, rom_version, country_code = vbmeta_result
-    print(f"{Colors.OKGREEN}[PASS] vbmeta Prop 검증 완료{Colors.ENDC}")
-    update_sub_task(2, 'done')
-    global_print_progress(3, step2_total_steps, "STEP 2")
-    
-    # [작업 4] vendor_boot Hex 지역 코드 분석
-    update_sub_task(3, 'in_progress')
-    global_print_progress(3, step2_total_steps, "STEP 2")
-    
-    vendor_boot_path = os.path.join(image_dir, "vendor_boot.img")
-    hex_region_code = _analyze_vendor_boot_hex(vendor_boot_path)
-    if not hex_region_code:
-        return None, None
-    
-    print(f"{Colors.OKGREEN}[PASS] vendor_boot Hex 검증 완료{Colors.ENDC}")
-    update_sub_task(3, 'done')
-    global_print_progress(4, step2_total_steps, "STEP 2")
-    
-    # [작업 5] vbmeta_system 롤백 인덱스 추출
-    update_sub_task(4, 'in_progress')
-    global_print_progress(4, step2_total_steps, "STEP 2")
-    print(f"\n--- 검증 4: vbmeta_system 롤백 인덱스 ---")
-    
-    vbmeta_system_path = os.path.join(image_dir, "vbmeta_system.img")
-    vbmeta_system_rollback = _extract_rollback_index(vbmeta_system_path, "vbmeta_system.img")
-    if not vbmeta_system_rollback:
-        return None, None
-    
-    print(f"  - vbmeta_system 롤백 인덱스: {vbmeta_system_rollback}")
-    print(f"{Colors.OKGREEN}  ✓ vbmeta_system 롤백 인덱스 추출 완료{Colors.ENDC}")
-    update_sub_task(4, 'done')
-    global_print_progress(5, step2_total_steps, "STEP 2")
-    
-    # [작업 6] boot 롤백 인덱스 추출
-    update_sub_task(5, 'in_progress')
-    global_print_progress(5, step2_total_steps, "STEP 2")
-    print(f"\n--- 검증 5: boot 롤백 인덱스 ---")
-    
-    boot_path = os.path.join(image_dir, "boot.img")
-    boot_rollback = _extract_rollback_index(boot_path, "boot.img")
-    if not boot_rollback:
-        return None, None
-    
-    print(f"  - boot 롤백 인덱스: {boot_rollback}")
-    print(f"{Colors.OKGREEN}  ✓ boot 롤백 인덱스 추출 완료{Colors.ENDC}")
-    update_sub_task(5, 'done')
-    global_print_progress(6, step2_total_steps, "STEP 2")
-    
-    # [작업 7] 검증 정보 저장
-    update_sub_task(6, 'in_progress')
-    global_print_progress(6, step2_total_steps, "STEP 2")
-    
-    save_rom_info_to_file(
-        model, rom_version, hex_region_code, country_code,
-        vbmeta_system_rollback, boot_rollback, step1_output_dir
-    )
-    
-    update_sub_task(6, 'done')
-    global_print_progress(7, step2_total_steps, "STEP 2")
-    
-    # [작업 8] _RAW 백업 생성
-    update_sub_task(7, 'in_progress')
-    global_print_progress(7, step2_total_steps, "STEP 2")
-    
+    # 작업 8의 _RAW 백업 복사를 미리 시작 (이름 검증 통과 후, 이후 검증과 동시 진행, 실패 시 취소)
     raw_backup_path = original_rom_path + FolderConstants.RAW_SUFFIX
-    if not _create_raw_backup(original_rom_path, raw_backup_path):
-        return None, None
+    backup_job = _start_raw_backup(original_rom_path, raw_backup_path)
+    
+    backup_completed = False
+    try:
+        # [작업 3] vbmeta Prop 분석 (2차 모델 검증)
+        update_sub_task(2, 'in_progress')
+        global_print_progress(2, step2_total_steps, "STEP 2")
+        
+        vbmeta_result = _analyze_vbmeta_prop(vbmeta_path, target_model_number)
+        if not vbmeta_result:
+            return None, None
+        
+        model, rom_version, country_code = vbmeta_result
+        print(f"{Colors.OKGREEN}[PASS] vbmeta Prop 검증 완료{Colors.ENDC}")
+        update_sub_task(2, 'done')
+        global_print_progress(3, step2_total_steps, "STEP 2")
+        
+        # [작업 4] vendor_boot Hex 지역 코드 분석
+        update_sub_task(3, 'in_progress')
+        global_print_progress(3, step2_total_steps, "STEP 2")
+        
+        hex_region_code = _analyze_vendor_boot_hex(vendor_boot_path)
+        if not hex_region_code:
+            return None, None
+        
+        print(f"{Colors.OKGREEN}[PASS] vendor_boot Hex 검증 완료{Colors.ENDC}")
+        update_sub_task(3, 'done')
+        global_print_progress(4, step2_total_steps, "STEP 2")
+        
+        # [작업 5] vbmeta_system 롤백 인덱스 추출
+        update_sub_task(4, 'in_progress')
+        global_print_progress(4, step2_total_steps, "STEP 2")
+        print(f"\n--- 검증 4: vbmeta_system 롤백 인덱스 ---")
+        
+        vbmeta_system_rollback = _extract_rollback_index(vbmeta_system_path, FileConstants.VBMETA_SYSTEM)
+        if not vbmeta_system_rollback:
+            return None, None
+        
+        print(f"  - vbmeta_system 롤백 인덱스: {vbmeta_system_rollback}")
+        print(f"{Colors.OKGREEN}  ✓ vbmeta_system 롤백 인덱스 추출 완료{Colors.ENDC}")
+        update_sub_task(4, 'done')
+        global_print_progress(5, step2_total_steps, "STEP 2")
+        
+        # [작업 6] boot 롤백 인덱스 추출
+        update_sub_task(5, 'in_progress')
+        global_print_progress(5, step2_total_steps, "STEP 2")
+        print(f"\n--- 검증 5: boot 롤백 인덱스 ---")
+        
+        boot_rollback = _extract_rollback_index(boot_path, FileConstants.BOOT)
+        if not boot_rollback:
+            return None, None
+        
+        print(f"  - boot 롤백 인덱스: {boot_rollback}")
+        print(f"{Colors.OKGREEN}  ✓ boot 롤백 인덱스 추출 완료{Colors.ENDC}")
+        update_sub_task(5, 'done')
+        global_print_progress(6, step2_total_steps, "STEP 2")
+        
+        # [작업 7] 검증 정보 저장
+        update_sub_task(6, 'in_progress')
+        global_print_progress(6, step2_total_steps, "STEP 2")
+        
+        save_rom_info_to_file(
+            model, rom_version, hex_region_code, country_code,
+            vbmeta_system_rollback, boot_rollback, step1_output_dir
+        )
+        
+        update_sub_task(6, 'done')
+        global_print_progress(7, step2_total_steps, "STEP 2")
+        
+        # [작업 8] _RAW 백업 생성
+        update_sub_task(7, 'in_progress')
+        global_print_progress(7, step2_total_steps, "STEP 2")
+        
+        if not _create_raw_backup(original_rom_path, raw_backup_path, backup_job):
+            return None, None
+        backup_completed = True
+    finally:
+        if not backup_completed:
+            _cancel_raw_backup(backup_job)
     
     update_sub_task(7, 'done')
     global_print_progress(8, step2_total_steps, "STEP 2")
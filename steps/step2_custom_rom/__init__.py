@@ -11,7 +11,9 @@
 - patch_folder: 패치용 폴더 생성
 - rollback_index: 롤백 인덱스 추출 및 정보 저장
 """
+import os
 import traceback
+from pathlib import Path
 from typing import Tuple, Optional, Dict
 
 from src.config import Colors
@@ -23,6 +25,7 @@ from src.progress import (
     print_standalone_progress, end_standalone_progress
 )
 from utils.ui import show_popup
+from utils.avb_tools import get_image_avb_details
 
 # 하위 모듈에서 필요한 함수들 import
 from .rsa_folder import (
@@ -57,13 +60,62 @@ __all__ = [
 ]
 
 
+# 롬 분석 결과 캐시 (같은 롬파일을 다시 선택했을 때 avbtool/Hex 분석 생략)
+# 키: _step2_cache_key() 결과, 값: (rom_type, rom_info, rom_indices)
+_STEP2_CACHE: Dict[tuple, tuple] = {}
+
+# 캐시 키에 수정 시각/크기를 포함할 분석 대상 이미지
+_STEP2_CACHE_IMAGES = ("vbmeta.img", "vendor_boot.img", "vbmeta_system.img", "boot.img")
+
+# 한 번에 AVB 정보를 파싱할 이미지 (이름 -> image 폴더 내 파일명)
+_AVB_DETAIL_IMAGES = {
+    'vbmeta': 'vbmeta.img',
+    'vbmeta_system': 'vbmeta_system.img',
+    'boot': 'boot.img',
+}
+
+
 # Helper Functions
 
 
-def _update_task_status(task_idx: int, status: str) -> None:
-    """진행률 업데이트 헬퍼 함수"""
+def _step2_cache_key(rom_path: str, target_model: str) -> Optional[tuple]:
+    """분석 결과 캐시 키 생성 (image 폴더/분석 대상 이미지가 바뀌면 키도 바뀜)
+    
+    Returns:
+        캐시 키 튜플 또는 None (stat 실패 시 캐시 사용 안 함)
+    """
+    image_dir = os.path.join(rom_path, 'image')
+    try:
+        stamps = [os.stat(image_dir).st_mtime_ns]
+        for name in _STEP2_CACHE_IMAGES:
+            st = os.stat(os.path.join(image_dir, name))
+            stamps.extend((st.st_mtime_ns, st.st_size))
+    except OSError:
+        return None
+    return (os.path.abspath(rom_path), target_model, tuple(stamps))
+
+
+def _parse_all_vbmeta(rom_path: str) -> Dict[str, Optional[Dict]]:
+    """vbmeta/vbmeta_system/boot AVB 정보를 한 번에 파싱
+    
+    롤백 인덱스 추출과 정보 파일 저장이 같은 결과를 나눠 씁니다.
+    
+    Returns:
+        {이름: get_image_avb_details() 결과} (파일이 없는 이미지는 제외)
+    """
+    image_dir = Path(rom_path) / 'image'
+    details: Dict[str, Optional[Dict]] = {}
+    for name, filename in _AVB_DETAIL_IMAGES.items():
+        path = image_dir / filename
+        if path.exists():
+            details[name] = get_image_avb_details(path)
+    return details
+
+
+def _update_task_status(task_idx: int, status: str, force: bool = False) -> None:
+    """진행률 업데이트 헬퍼 함수 (오류 상태는 항상 즉시 출력)"""
     update_standalone_task(task_idx, status)
-    print_standalone_progress()
+    print_standalone_progress(force=force or status == 'error')
 
 
 # Helper Functions (리팩토링)
@@ -198,38 +250,54 @@ def run_step_2_custom(
         
         _update_task_status(2, 'done')
         
-        # 4-5. vbmeta Prop 확인 + vendor_boot Hex 확인 (롬 타입 감지 + 2차 검증)
-        _update_task_status(3, 'in_progress')
+        # 4-7. 이전에 분석한 같은 롬파일이면 캐시된 결과 사용
+        avb_details = None
+        cache_key = _step2_cache_key(rom_path, target_model)
+        cached = _STEP2_CACHE.get(cache_key) if cache_key else None
+        if cached:
+            rom_type, rom_info, rom_indices = cached
+            print(f"\n{Colors.OKCYAN}[정보] 이전 분석 결과를 재사용합니다 (롬파일 변경 없음).{Colors.ENDC}")
+            for i in range(3, 7):
+                update_standalone_task(i, 'done')
+            print_standalone_progress()
+        else:
+            # 4-5. vbmeta Prop 확인 + vendor_boot Hex 확인 (롬 타입 감지 + 2차 검증)
+            _update_task_status(3, 'in_progress')
         
-        rom_type, rom_info = _detect_rom_type_with_error_handling(rom_path, target_model)
-        if not rom_type:
-            _update_task_status(3, 'error')
-            end_standalone_progress()
-            return None, None, None, None
+            rom_type, rom_info = _detect_rom_type_with_error_handling(rom_path, target_model)
+            if not rom_type:
+                _update_task_status(3, 'error')
+                end_standalone_progress()
+                return None, None, None, None
         
-        update_standalone_task(3, 'done')
-        _update_task_status(4, 'done')
+            update_standalone_task(3, 'done')
+            _update_task_status(4, 'done')
         
-        # 구조 검증 (UI 표시 없이 백그라운드 실행)
-        if not _validate_rom_structure_with_error(rom_path, rom_type):
-            for i in range(5, 9):
-                update_standalone_task(i, 'error')
-            print_standalone_progress()
-            end_standalone_progress()
-            return None, None, None, None
+            # 구조 검증 (UI 표시 없이 백그라운드 실행)
+            if not _validate_rom_structure_with_error(rom_path, rom_type):
+                for i in range(5, 9):
+                    update_standalone_task(i, 'error')
+                print_standalone_progress(force=True)
+                end_standalone_progress()
+                return None, None, None, None
         
-        # 5-6. vbmeta_system 롤백 확인 + boot 롤백 확인 (롤백 인덱스 추출)
-        _update_task_status(5, 'in_progress')
+            # 5-6. vbmeta_system 롤백 확인 + boot 롤백 확인 (롤백 인덱스 추출)
+            _update_task_status(5, 'in_progress')
         
-        rom_indices = extract_rollback_indices(rom_path)
+            avb_details = _parse_all_vbmeta(rom_path)
+            rom_indices = extract_rollback_indices(rom_path, avb_details)
         
-        update_standalone_task(5, 'done')  # vbmeta_system 롤백 확인
-        _update_task_status(6, 'done')  # boot 롤백 확인
+            update_standalone_task(5, 'done')  # vbmeta_system 롤백 확인
+            _update_task_status(6, 'done')  # boot 롤백 확인
+            
+            if cache_key:
+                _STEP2_CACHE[cache_key] = (rom_type, rom_info, rom_indices)
         
         # 7. 검증 정보 저장
         _update_task_status(7, 'in_progress')
         
-        save_custom_rom_info_to_file(rom_path, rom_type, target_model, rom_indices, step1_output_dir)
+        save_custom_rom_info_to_file(rom_path, rom_type, target_model, rom_indices, step1_output_dir,
+                                     avb_details)
         
         _update_task_status(7, 'done')
         
@@ -244,7 +312,7 @@ def run_step_2_custom(
             end_standalone_progress()
             return None, None, None, None
         
-        _update_task_status(8, 'done')
+        _update_task_status(8, 'done', force=True)
         
         # 완료
         end_standalone_progress()
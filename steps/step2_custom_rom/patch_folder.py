@@ -1,15 +1,26 @@
 """패치 폴더 생성 관련 함수들"""
 import os
 import shutil
+import sys
 import traceback
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from src.config import Colors
 from src.config import ROM_TOOLS_DIR
 from src.context import CopyProgressTracker
 from src.logger import log_error
-from utils.file_operations import get_total_files, remove_readonly_and_delete, copy_with_progress
+from utils.file_operations import remove_readonly_and_delete, copy_tree_parallel
+
+# Tools/RomTools 항목 캐시 (설치 후 바뀌지 않으므로 최초 1회만 나열)
+# (이름, 경로, 폴더 여부)
+_ROM_TOOLS_ENTRIES: Optional[List[Tuple[str, str, bool]]] = None
+
+
+def _write_block(*lines: str) -> None:
+    """여러 줄을 한 번의 write로 출력 (줄마다 print하는 콘솔 쓰기 횟수 절감)"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def detect_rom_structure(rom_path: Path) -> str:
@@ -24,123 +35,139 @@ def detect_rom_structure(rom_path: Path) -> str:
         'china': 내수롬 구조 (툴이 tool/ 폴더에)
         'unknown': 알 수 없음
     """
-    rom_path = Path(rom_path)
+    rom_dir = os.fspath(rom_path)
+    
+    # 최상위 항목을 한 번만 읽어 이름 -> 폴더 여부로 보관
+    try:
+        with os.scandir(rom_dir) as it:
+            top_entries = {entry.name: entry.is_dir() for entry in it}
+    except OSError:
+        return 'unknown'
     
     # 1. tool/ 폴더 존재 확인
-    tool_folder = rom_path / "tool"
-    if tool_folder.exists() and tool_folder.is_dir():
+    if top_entries.get("tool"):
         # fh_loader.exe가 tool/ 안에 있으면 내수롬 구조
-        if (tool_folder / "fh_loader.exe").exists():
+        if os.path.exists(os.path.join(rom_dir, "tool", "fh_loader.exe")):
             return 'china'
     
     # 2. fh_loader.exe가 루트에 있으면 글로벌 구조
-    if (rom_path / "fh_loader.exe").exists():
+    if "fh_loader.exe" in top_entries:
         return 'global'
     
     return 'unknown'
 
 
-def convert_china_to_global_structure(rom_path: Path) -> bool:
+def _is_preserved_item(name: str) -> bool:
+    """내수롬 → 글로벌 변환 시 보존할 최상위 항목인지 확인"""
+    return (
+        name == "image"  # image/ 폴더 (필수)
+        # 스크립트가 생성한 파일들
+        or (name.startswith(("CustomRomFile_Info_", "RomFile_Info_")) and name.endswith(".txt"))
+        # 백업 파일들 (*.original, *.patched)
+        or name.endswith((".original", ".patched"))
+    )
+
+
+def _get_rom_tools_entries() -> List[Tuple[str, str, bool]]:
+    """Tools/RomTools 항목 목록 (scandir 1회 결과를 캐시)"""
+    global _ROM_TOOLS_ENTRIES
+    if _ROM_TOOLS_ENTRIES is None:
+        with os.scandir(ROM_TOOLS_DIR) as it:
+            _ROM_TOOLS_ENTRIES = [(entry.name, entry.path, entry.is_dir()) for entry in it]
+    return _ROM_TOOLS_ENTRIES
+
+
+def _copy_rom_tools(target_dir: str) -> int:
+    """Tools/RomTools의 표준 툴을 대상 폴더에 복사
+    
+    Returns:
+        복사된 항목 개수
     """
-    내수롬 구조를 글로벌 구조로 변환
+    copied_count = 0
+    for name, path, is_dir in _get_rom_tools_entries():
+        target = os.path.join(target_dir, name)
+        try:
+            if is_dir:
+                shutil.copytree(path, target)
+            else:
+                shutil.copy2(path, target)
+            copied_count += 1
+        except Exception as e:
+            print(f"  {Colors.WARNING}⚠️  {name} 복사 실패: {e}{Colors.ENDC}")
+            log_error(f"구조 변환 중 복사 실패: {path}", exception=e, context="convert_structure")
     
-    작업:
-    1. image/ 폴더와 스크립트 생성 파일만 보존
-    2. 나머지 모든 파일/폴더 삭제
-    3. Tools/RomTools의 표준 툴 복사
+    return copied_count
+
+
+def _build_patch_from_china(rom_path: str, patch_path: str, copy_tracker: CopyProgressTracker) -> bool:
+    """내수롬에서 필요한 항목만 복사해 글로벌 구조의 패치 폴더 생성
     
-    Args:
-        rom_path: 변환할 롬 경로 (실제 image가 있는 경로)
+    전체를 복사한 뒤 대부분을 삭제하는 대신 image/, 보존 파일,
+    Tools/RomTools만 새 패치 폴더에 복사합니다.
     
     Returns:
         성공 시 True
     """
-    rom_path = Path(rom_path)
-    
-    # ROM_TOOLS_DIR 확인
     if not ROM_TOOLS_DIR.exists():
         print(f"{Colors.FAIL}[오류] Tools/RomTools 폴더를 찾을 수 없습니다!{Colors.ENDC}")
         print(f"  경로: {ROM_TOOLS_DIR}")
         return False
     
-    print(f"\n{Colors.OKCYAN}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.BOLD}[구조 변환] 내수롬 → 글로벌 (RSA 호환){Colors.ENDC}")
-    print(f"{Colors.OKCYAN}{'='*60}{Colors.ENDC}")
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # STEP 1: 보존할 항목 확인
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    preserve_items = set()
-    
-    # 1-1. image/ 폴더 (필수)
-    image_folder = rom_path / "image"
-    if image_folder.exists():
-        preserve_items.add("image")
-    
-    # 1-2. 스크립트가 생성한 파일들
-    for file in rom_path.glob("CustomRomFile_Info_*.txt"):
-        preserve_items.add(file.name)
-    
-    for file in rom_path.glob("RomFile_Info_*.txt"):
-        preserve_items.add(file.name)
+    rom_dir = os.fspath(rom_path)
+    with os.scandir(rom_dir) as it:
+        preserved_entries = [entry for entry in it if _is_preserved_item(entry.name)]
     
-    # 1-3. 백업 파일들 (*.original, *.patched)
-    for pattern in ["*.original", "*.patched"]:
-        for file in rom_path.glob(pattern):
-            preserve_items.add(file.name)
+    os.makedirs(patch_path, exist_ok=True)
     
-    print(f"\n[1/3] 보존할 항목: {len(preserve_items)}개")
-    for item in sorted(preserve_items):
-        print(f"  ✓ {item}")
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # STEP 2: 나머지 모두 삭제
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    print(f"\n[2/3] 불필요한 파일/폴더 삭제 중...")
-    deleted_count = 0
-    
-    for item in rom_path.iterdir():
-        if item.name not in preserve_items:
-            try:
-                if item.is_dir():
-                    remove_readonly_and_delete(item)
-                    deleted_count += 1
-                else:
-                    item.unlink()
-                    deleted_count += 1
-            except Exception as e:
-                print(f"  {Colors.WARNING}⚠️  {item.name} 삭제 실패: {e}{Colors.ENDC}")
-                log_error(f"구조 변환 중 삭제 실패: {item}", exception=e, context="convert_structure")
-    
-    print(f"  {Colors.OKGREEN}✓ {deleted_count}개 항목 삭제 완료{Colors.ENDC}")
+    print(f"\n[1/2] image/ 폴더 및 보존 항목 복사 중...")
+    for entry in preserved_entries:
+        target = os.path.join(patch_path, entry.name)
+        if entry.name == "image":
+            copy_tree_parallel(entry.path, target, copy_tracker, preserve_metadata=False)
+            print()  # 줄바꿈
+            print(f"  총 {copy_tracker.total_file_count}개의 파일을 복사했습니다.")
+        elif entry.is_dir():
+            shutil.copytree(entry.path, target)
+        else:
+            shutil.copy2(entry.path, target)
+    print(f"  {Colors.OKGREEN}✓ {len(preserved_entries)}개 항목 복사 완료{Colors.ENDC}")
     
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # STEP 3: 표준 롬 툴 복사
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    print(f"\n[3/3] 표준 롬 툴 복사 중...")
+    print(f"\n[2/2] 표준 롬 툴 복사 중...")
     print(f"  출처: Tools/RomTools/")
+    copied_count = _copy_rom_tools(patch_path)
+    print(f"  {Colors.OKGREEN}✓ {copied_count}개 항목 복사 완료{Colors.ENDC}")
     
-    copied_count = 0
-    for item in ROM_TOOLS_DIR.iterdir():
-        target = rom_path / item.name
-        try:
-            if item.is_dir():
-                shutil.copytree(item, target)
-                copied_count += 1
-            else:
-                shutil.copy2(item, target)
-                copied_count += 1
-        except Exception as e:
-            print(f"  {Colors.WARNING}⚠️  {item.name} 복사 실패: {e}{Colors.ENDC}")
-            log_error(f"구조 변환 중 복사 실패: {item}", exception=e, context="convert_structure")
+    return True
+
+
+def _check_free_space(rom_path: str, patch_path: str) -> bool:
+    """패치 폴더를 만들 드라이브의 여유 공간 확인 (image/ 크기 + 10%)
     
-    print(f"  {Colors.OKGREEN}✓ {copied_count}개 항목 복사 완료{Colors.ENDC}")
+    복사 도중 공간 부족으로 실패해 수 GB의 I/O를 낭비하지 않도록 미리 확인합니다.
+    대부분의 용량은 image/ 바로 아래 이미지 파일이므로 하위 폴더는 합산하지 않습니다.
     
-    print(f"\n{Colors.OKGREEN}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.OKGREEN}✅ 구조 변환 완료! (글로벌 구조, RSA 호환){Colors.ENDC}")
-    print(f"{Colors.OKGREEN}{'='*60}{Colors.ENDC}\n")
+    Returns:
+        공간이 충분하거나 확인할 수 없으면 True
+    """
+    try:
+        with os.scandir(os.path.join(rom_path, 'image')) as it:
+            image_size = sum(entry.stat().st_size for entry in it if entry.is_file())
+        free = shutil.disk_usage(os.path.dirname(os.path.abspath(patch_path))).free
+    except OSError as e:
+        print(f"{Colors.WARNING}⚠️  여유 공간을 확인할 수 없습니다: {e}{Colors.ENDC}")
+        return True
     
-    return True
+    required = int(image_size * 1.1)
+    if free >= required:
+        return True
+    
+    _write_block(
+        f"\n{Colors.FAIL}[오류] 패치 폴더를 만들 디스크 공간이 부족합니다.{Colors.ENDC}",
+        f"  필요: {required / 1024**3:.1f} GB (image 폴더 + 10%)",
+        f"  여유: {free / 1024**3:.1f} GB",
+        f"  {Colors.WARNING}공간을 확보한 뒤 다시 시도하세요.{Colors.ENDC}",
+    )
+    return False
 
 
 def create_patch_folder(rom_path: str, selected_path: str, is_nested: bool) -> Optional[str]:
@@ -160,13 +187,27 @@ def create_patch_folder(rom_path: str, selected_path: str, is_nested: bool) -> O
     # _PATCH 경로는 선택한 경로 기준으로 생성
     patch_path = f"{selected_path}_PATCH"
     
+    # 구조 감지 (복사 전) - 내수롬은 필요한 항목만 복사, 알 수 없는 구조는 사용자 확인
+    structure_type = detect_rom_structure(Path(rom_path))
+    if structure_type == 'unknown':
+        _write_block(
+            f"\n{Colors.WARNING}⚠️  알 수 없는 롬 구조입니다 (fh_loader.exe를 찾을 수 없음).{Colors.ENDC}",
+            f"  위치: {rom_path}",
+        )
+        response = input(f"{Colors.WARNING}그래도 패치 폴더를 생성하시겠습니까? (y/n): {Colors.ENDC}").strip().lower()
+        if response != 'y':
+            print(f"\n{Colors.OKCYAN}작업을 취소합니다.{Colors.ENDC}")
+            return None
+    
     # 기존 _PATCH 폴더 존재 확인
     if os.path.exists(patch_path):
-        print(f"\n{Colors.WARNING}{'='*60}{Colors.ENDC}")
-        print(f"{Colors.WARNING}⚠️  기존 패치 흔적이 발견되었습니다!{Colors.ENDC}")
-        print(f"{Colors.WARNING}{'='*60}{Colors.ENDC}")
-        print(f"  위치: {patch_path}")
-        print(f"\n{Colors.OKCYAN}기존 패치 폴더를 삭제하고 새로 생성하여 계속 진행하시겠습니까?{Colors.ENDC}")
+        _write_block(
+            f"\n{Colors.WARNING}{'='*60}{Colors.ENDC}",
+            f"{Colors.WARNING}⚠️  기존 패치 흔적이 발견되었습니다!{Colors.ENDC}",
+            f"{Colors.WARNING}{'='*60}{Colors.ENDC}",
+            f"  위치: {patch_path}",
+            f"\n{Colors.OKCYAN}기존 패치 폴더를 삭제하고 새로 생성하여 계속 진행하시겠습니까?{Colors.ENDC}",
+        )
         
         while True:
             response = input(f"{Colors.WARNING}삭제 후 재생성 (y/n): {Colors.ENDC}").strip().lower()
@@ -187,34 +228,57 @@ def create_patch_folder(rom_path: str, selected_path: str, is_nested: bool) -> O
             else:
                 print(f"{Colors.FAIL}'y' 또는 'n'을 입력하세요.{Colors.ENDC}")
     
+    # 복사 전에 여유 공간 확인 (기존 _PATCH 삭제 후 기준)
+    if not _check_free_space(rom_path, patch_path):
+        return None
+    
     # 패치용 폴더 생성
-    print(f"\n{Colors.BOLD}[복사 시작]{Colors.ENDC}")
     if is_nested:
-        print(f"  원본: {rom_path} (중첩 구조 - 내부 폴더만 복사)")
-        print(f"  패치용: {patch_path}")
-        print(f"  {Colors.OKCYAN}중첩된 내부 폴더만 복사하여 정상 구조로 생성합니다.{Colors.ENDC}")
+        _write_block(
+            f"\n{Colors.BOLD}[복사 시작]{Colors.ENDC}",
+            f"  원본: {rom_path} (중첩 구조 - 내부 폴더만 복사)",
+            f"  패치용: {patch_path}",
+            f"  {Colors.OKCYAN}중첩된 내부 폴더만 복사하여 정상 구조로 생성합니다.{Colors.ENDC}",
+        )
     else:
-        print(f"  원본: {rom_path} (유지됨)")
-        print(f"  패치용: {patch_path}")
+        _write_block(
+            f"\n{Colors.BOLD}[복사 시작]{Colors.ENDC}",
+            f"  원본: {rom_path} (유지됨)",
+            f"  패치용: {patch_path}",
+        )
     
     try:
-        print(f"\n{Colors.BOLD}[정보] 복사할 총 파일 개수를 세는 중...{Colors.ENDC}")
-        total_files = get_total_files(rom_path)
-        print(f"  총 {total_files}개의 파일을 복사합니다.\n")
-        
-        # 복사 진행률 추적기 초기화
+        # 복사 진행률 추적기 (총 개수는 복사 목록을 만들 때 함께 설정됨)
         copy_tracker = CopyProgressTracker()
-        copy_tracker.set_total(total_files)
         
-        # copy_with_progress wrapper (copytree는 (src, dst) 2개 인자만 받음)
-        def copy_func(src, dst) -> None:
-            """파일 복사 wrapper"""
-            copy_with_progress(src, dst, copy_tracker)
-        
-        # 중첩 구조: rom_path (내부 폴더)만 복사
-        # 정상 구조: rom_path 전체 복사
-        shutil.copytree(rom_path, patch_path, copy_function=copy_func)
-        print()  # 줄바꿈
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        # 내수롬은 필요한 항목만 복사하여 글로벌 구조로 생성
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        if structure_type == 'china':
+            _write_block(
+                f"\n{Colors.WARNING}{'='*60}{Colors.ENDC}",
+                f"{Colors.WARNING}⚠️  내수롬 구조 감지 (RSA 비호환){Colors.ENDC}",
+                f"{Colors.WARNING}{'='*60}{Colors.ENDC}",
+                f"\n{Colors.BOLD}글로벌 구조로 패치 폴더를 생성합니다:{Colors.ENDC}",
+                "  • image/ 폴더 → 복사",
+                "  • tool/ 폴더 → 제외 (표준 툴로 교체)",
+                "  • 기타 파일 → 제외",
+                "  • Tools/RomTools/ → 복사",
+                f"\n{Colors.OKCYAN}이 작업은 RSA 호환성을 위해 필수입니다.{Colors.ENDC}",
+            )
+            
+            if not _build_patch_from_china(rom_path, patch_path, copy_tracker):
+                print(f"{Colors.FAIL}✗ 구조 변환 실패{Colors.ENDC}")
+                return None
+        else:
+            # 중첩 구조: rom_path (내부 폴더)만 복사
+            # 정상 구조: rom_path 전체 복사
+            # 한 번의 scandir 순회로 파일 개수 집계와 복사 목록 생성을 함께 처리,
+            # 파일 복사는 스레드 풀로 동시에 진행 (스레드 수: ROM_COPY_THREADS)
+            # 패치 폴더는 매번 새로 만들므로 파일 시간 등 메타데이터는 복사하지 않음
+            copy_tree_parallel(rom_path, patch_path, copy_tracker, preserve_metadata=False)
+            print()  # 줄바꿈
+            print(f"  총 {copy_tracker.total_file_count}개의 파일을 복사했습니다.")
         
         print(f"\n{Colors.OKGREEN}✓ 패치용 폴더 생성 완료!{Colors.ENDC}")
         if is_nested:
@@ -225,25 +289,8 @@ def create_patch_folder(rom_path: str, selected_path: str, is_nested: bool) -> O
         
         copy_tracker.reset()
         
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 구조 감지 및 자동 변환 (내수롬 → 글로벌)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        structure_type = detect_rom_structure(Path(patch_path))
-        
         if structure_type == 'china':
-            print(f"\n{Colors.WARNING}{'='*60}{Colors.ENDC}")
-            print(f"{Colors.WARNING}⚠️  내수롬 구조 감지 (RSA 비호환){Colors.ENDC}")
-            print(f"{Colors.WARNING}{'='*60}{Colors.ENDC}")
-            print(f"\n{Colors.BOLD}글로벌 구조로 자동 변환합니다:{Colors.ENDC}")
-            print(f"  • image/ 폴더 → 보존")
-            print(f"  • tool/ 폴더 → 삭제 (표준 툴로 교체)")
-            print(f"  • 기타 파일 → 삭제")
-            print(f"  • Tools/RomTools/ → 복사")
-            print(f"\n{Colors.OKCYAN}이 작업은 RSA 호환성을 위해 필수입니다.{Colors.ENDC}")
-            
-            if not convert_china_to_global_structure(Path(patch_path)):
-                print(f"{Colors.FAIL}✗ 구조 변환 실패{Colors.ENDC}")
-                return None
+            print(f"\n{Colors.OKGREEN}✅ 구조 변환 완료! (글로벌 구조, RSA 호환){Colors.ENDC}")
         
         elif structure_type == 'global':
             print(f"\n{Colors.OKGREEN}✓ 글로벌 구조 감지 (RSA 호환){Colors.ENDC}")
@@ -1,4 +1,5 @@
 """롤백 인덱스 관련 함수들"""
+import mmap
 import os
 import re
 import sys
@@ -7,16 +8,24 @@ from typing import Optional, Dict
 from datetime import datetime
 
 from src.config import Colors
-from src.config import AVBTOOL_PY
-from utils.avb_tools import get_image_avb_details
-from utils.command import run_command
-from utils.region_check import check_region_patterns
+from utils.avb_tools import get_image_avb_details, cached_avbtool_info
+from utils.region_check import find_region_code
 
+# vbmeta fingerprint Prop에서 (모델, 롬 버전, 국가 코드) 추출
+_FINGERPRINT_RE = re.compile(
+    r"'[^/]+/([^/]+)/[^:]+:[^/]+/((.*?)_(PRC|ROW)):user/release-keys'"
+)
 
-def extract_rollback_indices(rom_path: str) -> Optional[Dict[str, str]]:
+
+def extract_rollback_indices(rom_path: str,
+                             avb_details: Optional[Dict[str, Optional[Dict]]] = None) -> Optional[Dict[str, str]]:
     """
     롬파일에서 롤백 인덱스 추출
     
+    Args:
+        rom_path: 롬파일 경로
+        avb_details: 미리 파싱한 {이미지 이름: AVB 정보} (있으면 재파싱 생략)
+    
     Returns:
         {'boot': 'xxx', 'vbmeta_system': 'yyy'} 또는 실패 시 None
     """
@@ -27,19 +36,27 @@ def extract_rollback_indices(rom_path: str) -> Optional[Dict[str, str]]:
     
     # vbmeta_system.img 롤백 인덱스
     vbmeta_system_path = os.path.join(image_dir, 'vbmeta_system.img')
-    if os.path.exists(vbmeta_system_path):
+    if avb_details is not None and 'vbmeta_system' in avb_details:
+        details = avb_details['vbmeta_system']
+    elif os.path.exists(vbmeta_system_path):
         details = get_image_avb_details(Path(vbmeta_system_path))
-        if details and 'rollback_index' in details:
-            rom_indices['vbmeta_system'] = details['rollback_index']
-            print(f"  ✓ vbmeta_system RB: {details['rollback_index']}")
+    else:
+        details = None
+    if details and 'rollback_index' in details:
+        rom_indices['vbmeta_system'] = details['rollback_index']
+        print(f"  ✓ vbmeta_system RB: {details['rollback_index']}")
     
     # boot.img 롤백 인덱스
     boot_path = os.path.join(image_dir, 'boot.img')
-    if os.path.exists(boot_path):
+    if avb_details is not None and 'boot' in avb_details:
+        details = avb_details['boot']
+    elif os.path.exists(boot_path):
         details = get_image_avb_details(Path(boot_path))
-        if details and 'rollback_index' in details:
-            rom_indices['boot'] = details['rollback_index']
-            print(f"  ✓ boot RB: {details['rollback_index']}")
+    else:
+        details = None
+    if details and 'rollback_index' in details:
+        rom_indices['boot'] = details['rollback_index']
+        print(f"  ✓ boot RB: {details['rollback_index']}")
     
     if not rom_indices:
         print(f"  {Colors.WARNING}⚠ 롤백 인덱스를 추출할 수 없습니다.{Colors.ENDC}")
@@ -49,8 +66,12 @@ def extract_rollback_indices(rom_path: str) -> Optional[Dict[str, str]]:
 
 
 def save_custom_rom_info_to_file(rom_path: str, rom_type: str, target_model: str, 
-                                 rom_indices: Optional[Dict[str, str]], step1_output_dir: Optional[str] = None) -> None:
-    """롬파일 정보를 txt 파일로 저장 (RSA 공식 롬 형식과 동일)"""
+                                 rom_indices: Optional[Dict[str, str]], step1_output_dir: Optional[str] = None,
+                                 avb_details: Optional[Dict[str, Optional[Dict]]] = None) -> None:
+    """롬파일 정보를 txt 파일로 저장 (RSA 공식 롬 형식과 동일)
+    
+    avb_details에 vbmeta 정보가 있으면 fingerprint Prop을 거기서 바로 읽습니다.
+    """
     print(f"\n{Colors.BOLD}[정보] 롬파일 분석 결과를 .txt 파일로 저장합니다...{Colors.ENDC}")
     
     now = datetime.now()
@@ -75,24 +96,39 @@ def save_custom_rom_info_to_file(rom_path: str, rom_type: str, target_model: str
     rom_version = "N/A"
     country_code = "ROW" if rom_type == 'global' else "PRC"
     
-    if os.path.exists(vbmeta_path):
+    vbmeta_details = avb_details.get('vbmeta') if avb_details else None
+    if vbmeta_details:
+        # 미리 파싱한 Prop 사용 (값은 따옴표가 제거된 상태이므로 다시 감싸서 매칭)
+        fingerprints = [value for key, value in vbmeta_details.items()
+                        if 'fingerprint' in key and isinstance(value, str)]
+        for value in fingerprints:
+            match = _FINGERPRINT_RE.search(f"'{value}'")
+            if match:
+                model_number = match.group(1)
+                rom_version = match.group(2)
+                country_code = match.group(4)
+                break  # 첫 번째 매칭만 사용
+        else:
+            if fingerprints:
+                print(f"  {Colors.WARNING}⚠ 정규표현식 매칭 실패: {fingerprints[0][:100]}{Colors.ENDC}")
+            else:
+                print(f"  {Colors.WARNING}⚠ vbmeta.img에서 fingerprint Prop을 찾을 수 없습니다.{Colors.ENDC}")
+    elif os.path.exists(vbmeta_path):
         try:
-            from config.paths import PYTHON_EXE
-            cmd = [PYTHON_EXE, AVBTOOL_PY, 'info_image', '--image', vbmeta_path]
-            success, output, _ = run_command(cmd, "vbmeta.img Prop 추출")
+            # avbtool 출력 캐시 재사용 (같은 세션에서 이미 분석한 이미지는 재실행 안 함)
+            success, output = cached_avbtool_info(vbmeta_path)
             
             if success and output:
                 # fingerprint에서 모델, 롬 버전, 국가 코드 추출
-                fingerprint_regex = re.compile(
-                    r"'[^/]+/([^/]+)/[^:]+:[^/]+/((.*?)_(PRC|ROW)):user/release-keys'"
-                )
-                
                 fingerprint_found = False
                 for line in output.splitlines():
+                    # 대부분의 줄은 strip 없이 부분 문자열 검사만으로 건너뜀
+                    if "fingerprint" not in line:
+                        continue
                     line_stripped = line.strip()
-                    if line_stripped.startswith("Prop:") and "fingerprint" in line_stripped:
+                    if line_stripped.startswith("Prop:"):
                         fingerprint_found = True
-                        match = fingerprint_regex.search(line_stripped)
+                        match = _FINGERPRINT_RE.search(line_stripped)
                         if match:
                             model_number = match.group(1)
                             rom_version = match.group(2)
@@ -119,20 +155,15 @@ def save_custom_rom_info_to_file(rom_path: str, rom_type: str, target_model: str
     
     if os.path.exists(vendor_boot_path):
         try:
-            with open(vendor_boot_path, 'rb') as f:
-                vendor_data = f.read()
-            
-            found_prc, found_iprc, found_row, found_irow = check_region_patterns(vendor_data)
-            
-            # 지역 코드 판정
-            if found_irow:
-                hex_region_code = "IROW (Hex)"
-            elif found_row:
-                hex_region_code = "ROW (Hex)"
-            elif found_iprc:
-                hex_region_code = "IPRC (Hex)"
-            elif found_prc:
-                hex_region_code = "PRC (Hex)"
+            # mmap으로 파일 전체를 메모리에 복사하지 않고 페이지 캐시에서 바로 스캔
+            region_code = None
+            if os.path.getsize(vendor_boot_path) > 0:
+                with open(vendor_boot_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # 지역 코드 판정 (IROW > ROW > IPRC > PRC, 우선순위가 높은 패턴이 있으면 나머지는 검색 생략)
+                    region_code = find_region_code(mm)
+            if region_code:
+                hex_region_code = f"{region_code} (Hex)"
         except Exception as e:
             print(f"  {Colors.WARNING}⚠ vendor_boot.img Hex 분석 중 오류: {e}{Colors.ENDC}")
     
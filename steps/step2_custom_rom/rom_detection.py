@@ -1,57 +1,131 @@
 """ROM 타입 감지 관련 함수들"""
+import mmap
 import os
 import re
 import sys
-from typing import Tuple, Dict, Any
+from collections import Counter
+from typing import Tuple, Dict, Any, Optional
 
 from src.config import Colors
-from src.config import AVBTOOL_PY
-from utils.command import run_command
+from utils.avb_tools import cached_avbtool_info
+from utils.region_check import check_region_patterns
+
+# avbtool 출력 전체에서 fingerprint Prop 줄의 모델 번호 추출 (줄 단위 매칭, 줄바꿈을 넘지 않음)
+_FINGERPRINT_RE = re.compile(
+    r"^[ \t]*Prop:[^\n]*?fingerprint[^\n]*?"
+    r"'[^/\n]+/([^/\n]+)/[^:\n]+:[^/\n]+/((.*?)_(PRC|ROW)):user/release-keys'",
+    re.MULTILINE
+)
+
+# Prop 문자열의 PRC/ROW 토큰 (대소문자 무시)
+_REGION_TOKEN_RE = re.compile(r"PRC|ROW", re.IGNORECASE)
+
+# vendor_boot Hex 패턴 발견 플래그 (비트)
+_HEX_FLAG_PRC = 1 << 0
+_HEX_FLAG_IPRC = 1 << 1
+_HEX_FLAG_ROW = 1 << 2
+_HEX_FLAG_IROW = 1 << 3
+
+
+def _build_hex_verdicts() -> Dict[int, Tuple[Optional[str], Optional[str]]]:
+    """16가지 플래그 조합 -> (Hex 판정, 오류 메시지) 판정표 생성 (모듈 로드 시 1회)"""
+    verdicts = {}
+    for flags in range(16):
+        has_prc_type = bool(flags & (_HEX_FLAG_PRC | _HEX_FLAG_IPRC))
+        has_row_type = bool(flags & (_HEX_FLAG_ROW | _HEX_FLAG_IROW))
+        both_prc = flags & (_HEX_FLAG_PRC | _HEX_FLAG_IPRC) == _HEX_FLAG_PRC | _HEX_FLAG_IPRC
+        both_row = flags & (_HEX_FLAG_ROW | _HEX_FLAG_IROW) == _HEX_FLAG_ROW | _HEX_FLAG_IROW
+        
+        # 혼합 체크 (우선순위: 계열 혼합 > PRC/IPRC 혼합 > ROW/IROW 혼합 > 없음)
+        if has_prc_type and has_row_type:
+            verdicts[flags] = (None, "vendor_boot.img에 PRC/IPRC와 ROW/IROW가 혼합되어 있습니다")
+        elif both_prc:
+            verdicts[flags] = (None, "vendor_boot.img에 HEX_PRC와 HEX_IPRC가 혼합되어 있습니다 (롬파일 이상)")
+        elif both_row:
+            verdicts[flags] = (None, "vendor_boot.img에 HEX_ROW와 HEX_IROW가 혼합되어 있습니다 (롬파일 이상)")
+        elif has_prc_type:
+            verdicts[flags] = ('PRC', None)
+        elif has_row_type:
+            verdicts[flags] = ('ROW', None)
+        else:
+            verdicts[flags] = (None, "vendor_boot.img에서 지역 코드(HEX)를 찾을 수 없습니다")
+    return verdicts
+
+
+_HEX_VERDICT = _build_hex_verdicts()
+
+# 최종 판정표: (Prop 판정, vendor_boot 존재, Hex 판정) -> 롬 타입
+_FINAL_DECISION = {
+    ('PRC', False, None): 'china',    # vendor_boot 없음 → 내수롬 가능
+    ('PRC', True, 'PRC'): 'china',    # Prop PRC + Hex PRC → 내수롬 확정
+    ('ROW', True, 'ROW'): 'global',   # Prop ROW + Hex ROW → 글로벌롬 확정
+}
+
+# 판정 불가 조합 -> 오류 메시지
+_FINAL_DECISION_ERRORS = {
+    ('PRC', True, 'ROW'): "Prop은 PRC인데 vendor_boot Hex는 ROW입니다 (롬파일 이상)",
+    ('ROW', False, None): "Prop은 ROW인데 vendor_boot.img가 없습니다 (롬파일 이상)",
+    ('ROW', True, 'PRC'): "Prop은 ROW인데 vendor_boot Hex는 PRC입니다 (롬파일 이상)",
+}
+
+# 롬 타입 감지 결과 캐시: _detection_cache_key() -> (rom_type, rom_info)
+# 같은 롬파일을 다시 선택하면 avbtool 실행과 vendor_boot 스캔을 생략
+_DETECTION_CACHE: Dict[tuple, Tuple[str, Dict[str, Any]]] = {}
+
+
+def _detection_cache_key(rom_path: str, target_model: Optional[str]) -> Optional[tuple]:
+    """감지 결과 캐시 키 (vbmeta/vendor_boot 수정 시각과 크기 포함)
+    
+    Returns:
+        캐시 키 또는 None (vbmeta.img가 없으면 캐시 없이 기존 경로로 오류 표시)
+    """
+    image_dir = os.path.join(rom_path, 'image')
+    try:
+        vbmeta_stat = os.stat(os.path.join(image_dir, 'vbmeta.img'))
+    except OSError:
+        return None
+    try:
+        vendor_stat = os.stat(os.path.join(image_dir, 'vendor_boot.img'))
+        vendor_stamp = (vendor_stat.st_mtime_ns, vendor_stat.st_size)
+    except OSError:
+        vendor_stamp = None  # vendor_boot 없음도 유효한 감지 결과 (내수롬)
+    return (
+        os.path.abspath(rom_path), target_model,
+        vbmeta_stat.st_mtime_ns, vbmeta_stat.st_size, vendor_stamp
+    )
 
 
 # Helper Functions (리팩토링)
 def _analyze_vbmeta_prop(vbmeta_path: str, target_model: str = None) -> Tuple[str, Dict[str, Any]]:
-    """1단계: vbmeta.img Prop 분석"""
+    """2단계: vbmeta.img Prop 분석"""
     if not os.path.exists(vbmeta_path):
         raise Exception(f"vbmeta.img 파일을 찾을 수 없습니다: {vbmeta_path}")
     
-    print(f"\n{Colors.BOLD}[1단계] vbmeta.img Prop 분석{Colors.ENDC}")
+    print(f"\n{Colors.BOLD}[2단계] vbmeta.img Prop 분석{Colors.ENDC}")
     
     try:
-        # avbtool로 Prop 추출
-        from config.paths import PYTHON_EXE
-        cmd = [PYTHON_EXE, AVBTOOL_PY, 'info_image', '--image', vbmeta_path]
-        success, output, _ = run_command(cmd, "vbmeta.img Prop 추출")
+        # avbtool로 Prop 추출 (프로세스 내 실행, 결과는 이후 단계에서도 캐시로 재사용)
+        success, output = cached_avbtool_info(vbmeta_path)
         
         if not success or not output:
             raise Exception("vbmeta.img Prop 추출 실패")
         
-        # Prop 문자열에서 PRC/ROW 카운트
-        prop_text = output.upper()
-        prc_count = prop_text.count('PRC')
-        row_count = prop_text.count('ROW')
+        # Prop 문자열에서 PRC/ROW 카운트 (upper() 사본 없이 1회 스캔)
+        token_counts = Counter(token.upper() for token in _REGION_TOKEN_RE.findall(output))
+        prc_count = token_counts['PRC']
+        row_count = token_counts['ROW']
         
         print(f"  - PRC 문자열: {prc_count}개")
         print(f"  - ROW 문자열: {row_count}개")
         
         # fingerprint에서 모델 번호 추출 (2차 검증용)
         rom_info = {'model': 'unknown'}
-        extracted_models = set()
-        fingerprint_regex = re.compile(
-            r"'[^/]+/([^/]+)/[^:]+:[^/]+/((.*?)_(PRC|ROW)):user/release-keys'"
-        )
-        
-        for line in output.splitlines():
-            line_stripped = line.strip()
-            if line_stripped.startswith("Prop:") and "fingerprint" in line_stripped:
-                match = fingerprint_regex.search(line_stripped)
-                if match:
-                    model = match.group(1)
-                    extracted_models.add(model)
+        # 줄 분할 없이 정규표현식 1회 스캔으로 모든 fingerprint Prop 처리
+        extracted_models = {match.group(1) for match in _FINGERPRINT_RE.finditer(output)}
         
         # 2차 검증: vbmeta Prop 모델 번호와 기기 모델 번호 비교
         if target_model and extracted_models:
-            prop_model = list(extracted_models)[0]
+            prop_model = next(iter(extracted_models))
             if prop_model != target_model:
                 raise Exception(
                     f"vbmeta Prop의 모델 번호가 기기 모델과 일치하지 않습니다.\n"
@@ -84,8 +158,8 @@ def _analyze_vbmeta_prop(vbmeta_path: str, target_model: str = None) -> Tuple[st
 
 
 def _analyze_vendor_boot_hex(vendor_boot_path: str) -> Tuple[bool, str]:
-    """2단계: vendor_boot.img Hex 코드 분석"""
-    print(f"\n{Colors.BOLD}[2단계] vendor_boot.img Hex 코드 분석{Colors.ENDC}")
+    """1단계: vendor_boot.img Hex 코드 분석"""
+    print(f"\n{Colors.BOLD}[1단계] vendor_boot.img Hex 코드 분석{Colors.ENDC}")
     
     if not os.path.exists(vendor_boot_path):
         print(f"  - vendor_boot.img: ✗ 없음")
@@ -95,44 +169,31 @@ def _analyze_vendor_boot_hex(vendor_boot_path: str) -> Tuple[bool, str]:
     print(f"  - vendor_boot.img: ✓ 존재")
     
     try:
-        # vendor_boot 바이너리 읽기
-        with open(vendor_boot_path, 'rb') as f:
-            vendor_data = f.read()
-        
-        # Hex 패턴 검색
-        from config.constants import HEX_PRC, HEX_IPRC, HEX_ROW, HEX_IROW
-        from utils.region_check import check_region_patterns
-        
-        found_prc, found_iprc, found_row, found_irow = check_region_patterns(vendor_data)
+        # Hex 패턴 검색 (mmap: 파일 전체를 메모리로 복사하지 않고 페이지 캐시에서 바로 스캔)
+        # 빈 파일은 mmap할 수 없으므로 패턴 없음으로 처리
+        if os.path.getsize(vendor_boot_path) > 0:
+            with open(vendor_boot_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as vendor_data:
+                found_prc, found_iprc, found_row, found_irow = check_region_patterns(vendor_data)
+        else:
+            found_prc = found_iprc = found_row = found_irow = False
         
         print(f"  - HEX_PRC:  {'✓ 발견' if found_prc else '✗ 없음'}")
         print(f"  - HEX_IPRC: {'✓ 발견' if found_iprc else '✗ 없음'}")
         print(f"  - HEX_ROW:  {'✓ 발견' if found_row else '✗ 없음'}")
         print(f"  - HEX_IROW: {'✓ 발견' if found_irow else '✗ 없음'}")
         
-        # Hex 판정
-        has_prc_type = found_prc or found_iprc
-        has_row_type = found_row or found_irow
-        
-        # 혼합 체크
-        if has_prc_type and has_row_type:
-            raise Exception("vendor_boot.img에 PRC/IPRC와 ROW/IROW가 혼합되어 있습니다")
-        
-        if found_prc and found_iprc:
-            raise Exception("vendor_boot.img에 HEX_PRC와 HEX_IPRC가 혼합되어 있습니다 (롬파일 이상)")
-        
-        if found_row and found_irow:
-            raise Exception("vendor_boot.img에 HEX_ROW와 HEX_IROW가 혼합되어 있습니다 (롬파일 이상)")
+        # Hex 판정 (4비트 플래그로 판정표 조회)
+        flags = (
+            (_HEX_FLAG_PRC if found_prc else 0) | (_HEX_FLAG_IPRC if found_iprc else 0)
+            | (_HEX_FLAG_ROW if found_row else 0) | (_HEX_FLAG_IROW if found_irow else 0)
+        )
+        hex_type, error_msg = _HEX_VERDICT[flags]
+        if error_msg:
+            raise Exception(error_msg)
         
-        # 판정
-        if has_prc_type:
-            hex_type = 'PRC'
-            print(f"  → Hex 판정: {Colors.WARNING}{hex_type}{Colors.ENDC}")
-        elif has_row_type:
-            hex_type = 'ROW'
-            print(f"  → Hex 판정: {Colors.OKGREEN}{hex_type}{Colors.ENDC}")
-        else:
-            raise Exception("vendor_boot.img에서 지역 코드(HEX)를 찾을 수 없습니다")
+        hex_color = Colors.WARNING if hex_type == 'PRC' else Colors.OKGREEN
+        print(f"  → Hex 판정: {hex_color}{hex_type}{Colors.ENDC}")
         
         return True, hex_type
     
@@ -143,50 +204,30 @@ def _analyze_vendor_boot_hex(vendor_boot_path: str) -> Tuple[bool, str]:
 
 
 def _make_final_decision(prop_type: str, has_vendor_boot: bool, hex_type: str) -> str:
-    """3단계: 최종 판정"""
+    """3단계: 최종 판정 (판정표 조회)"""
     print(f"\n{Colors.BOLD}[3단계] 최종 판정{Colors.ENDC}")
     
-    # 내수롬 조건
-    if prop_type == 'PRC':
-        if not has_vendor_boot:
-            # vendor_boot 없음 → 내수롬 가능
-            print(f"  - Prop: PRC")
-            print(f"  - vendor_boot: 없음")
-            return 'china'
-        elif hex_type == 'PRC':
-            # Prop PRC + Hex PRC → 내수롬 확정
-            print(f"  - Prop: PRC")
-            print(f"  - Hex: PRC")
-            return 'china'
-        else:
-            # Prop PRC + Hex ROW → 이상!
-            raise Exception(f"Prop은 PRC인데 vendor_boot Hex는 {hex_type}입니다 (롬파일 이상)")
-    
-    # 글로벌롬 조건
-    elif prop_type == 'ROW':
-        if not has_vendor_boot:
-            # vendor_boot 없음 → 이상 (글로벌롬인데 vendor_boot 없음)
-            raise Exception("Prop은 ROW인데 vendor_boot.img가 없습니다 (롬파일 이상)")
-        elif hex_type == 'ROW':
-            # Prop ROW + Hex ROW → 글로벌롬 확정
-            print(f"  - Prop: ROW")
-            print(f"  - Hex: ROW")
-            return 'global'
-        else:
-            # Prop ROW + Hex PRC → 이상!
-            raise Exception(f"Prop은 ROW인데 vendor_boot Hex는 {hex_type}입니다 (롬파일 이상)")
+    key = (prop_type, has_vendor_boot, hex_type)
+    rom_type = _FINAL_DECISION.get(key)
+    if rom_type:
+        print(f"  - Prop: {prop_type}")
+        print(f"  - Hex: {hex_type}" if has_vendor_boot else "  - vendor_boot: 없음")
+        return rom_type
     
-    else:
+    if key in _FINAL_DECISION_ERRORS:
+        raise Exception(_FINAL_DECISION_ERRORS[key])
+    if prop_type not in ('PRC', 'ROW'):
         raise Exception("알 수 없는 Prop 타입입니다")
+    raise Exception(f"Prop은 {prop_type}인데 vendor_boot Hex는 {hex_type}입니다 (롬파일 이상)")
 
 
 def detect_rom_type(rom_path: str, target_model: str = None) -> Tuple[str, Dict[str, Any]]:
     """
     롬 타입 자동 감지 (글로벌/내수) - 리팩토링 버전
     
-    정확한 감지 로직:
-    1. vbmeta_system.img Prop 분석 (ROW/PRC 문자열)
-    2. vendor_boot.img Hex 코드 분석 (HEX_ROW/HEX_PRC 패턴)
+    정확한 감지 로직 (비용이 적은 검사부터 실행):
+    1. vendor_boot.img Hex 코드 분석 (HEX_ROW/HEX_PRC 패턴, 혼합/누락이면 avbtool 없이 즉시 실패)
+    2. vbmeta.img Prop 분석 (ROW/PRC 문자열)
     3. 두 결과를 종합하여 판정
     4. (선택) vbmeta Prop 모델 번호와 기기 모델 번호 비교 (2차 검증)
     
@@ -203,6 +244,19 @@ def detect_rom_type(rom_path: str, target_model: str = None) -> Tuple[str, Dict[
     """
     print(f"\n{Colors.BOLD}[분석] 롬 타입 자동 감지 중...{Colors.ENDC}")
     
+    cache_key = _detection_cache_key(rom_path, target_model)
+    cached = _DETECTION_CACHE.get(cache_key) if cache_key else None
+    if cached:
+        rom_type, rom_info = cached
+        print(f"  - 폴더명: {os.path.basename(rom_path)}")
+        print(f"  {Colors.OKCYAN}[캐시] 이전 감지 결과 사용 (롬파일 변경 없음){Colors.ENDC}")
+        type_display = (
+            f"{Colors.WARNING}내수롬 (CN){Colors.ENDC}" if rom_type == 'china'
+            else f"{Colors.OKGREEN}글로벌롬 (ROW){Colors.ENDC}"
+        )
+        print(f"\n{Colors.BOLD}[결과] 롬 타입:{Colors.ENDC} {type_display}")
+        return rom_type, dict(rom_info)
+    
     rom_info = {
         'type': 'unknown',
         'model': 'unknown',
@@ -213,15 +267,15 @@ def detect_rom_type(rom_path: str, target_model: str = None) -> Tuple[str, Dict[
     folder_name = os.path.basename(rom_path)
     print(f"  - 폴더명: {folder_name}")
     
-    # 1단계: vbmeta.img Prop 분석
+    # 1단계: vendor_boot.img Hex 코드 분석 (mmap 스캔이라 avbtool보다 저렴, 이상 롬은 여기서 중단)
+    vendor_boot_path = os.path.join(rom_path, 'image', 'vendor_boot.img')
+    has_vendor_boot, hex_type = _analyze_vendor_boot_hex(vendor_boot_path)
+    
+    # 2단계: vbmeta.img Prop 분석 (최종 판정과 Hex 교차 검증에 항상 필요)
     vbmeta_path = os.path.join(rom_path, 'image', 'vbmeta.img')
     prop_type, prop_info = _analyze_vbmeta_prop(vbmeta_path, target_model)
     rom_info.update(prop_info)
     
-    # 2단계: vendor_boot.img Hex 코드 분석
-    vendor_boot_path = os.path.join(rom_path, 'image', 'vendor_boot.img')
-    has_vendor_boot, hex_type = _analyze_vendor_boot_hex(vendor_boot_path)
-    
     # 3단계: 최종 판정
     rom_type = _make_final_decision(prop_type, has_vendor_boot, hex_type)
     
@@ -234,6 +288,9 @@ def detect_rom_type(rom_path: str, target_model: str = None) -> Tuple[str, Dict[
     )
     print(f"\n{Colors.BOLD}[결과] 롬 타입:{Colors.ENDC} {type_display}")
     
+    if cache_key:
+        _DETECTION_CACHE[cache_key] = (rom_type, dict(rom_info))
+    
     return rom_type, rom_info
 
 
@@ -1,14 +1,40 @@
 """ROM 선택 관련 함수들"""
+import atexit
 import os
 import traceback
-import tkinter as tk
-from tkinter import filedialog
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 from src.config import Colors
 from src.config import RSA_ROMFILES_DIR
 from src.logger import log_error
 
+# 폴더 선택 다이얼로그용 숨김 Tk 루트 (최초 선택 시 생성, 프로세스 종료 시 정리)
+_tk_root = None
+
+
+def _destroy_tk_root() -> None:
+    """종료 시 Tk 루트 정리 (이미 닫혔으면 무시)"""
+    global _tk_root
+    if _tk_root is not None:
+        try:
+            _tk_root.destroy()
+        except Exception:
+            pass
+        _tk_root = None
+
+
+def _get_tk_root() -> Any:
+    """숨김 Tk 루트 반환 (재선택 시 Tcl 인터프리터를 다시 만들지 않도록 재사용)"""
+    global _tk_root
+    if _tk_root is None:
+        # Tk는 폴더 선택 시에만 로드 (다른 함수만 사용하는 경로는 import 비용 없음)
+        import tkinter as tk
+        _tk_root = tk.Tk()
+        _tk_root.withdraw()  # 메인 창 숨김
+        _tk_root.attributes('-topmost', True)  # 최상단 표시
+        atexit.register(_destroy_tk_root)
+    return _tk_root
+
 
 def select_rom_folder() -> Optional[str]:
     """
@@ -25,19 +51,18 @@ def select_rom_folder() -> Optional[str]:
     print(f"{Colors.OKCYAN}  (예: TB520FU_ROW_OPEN_USER_... 또는 TB520FU_CN_...){Colors.ENDC}")
     
     try:
-        root = tk.Tk()
-        root.withdraw()  # 메인 창 숨김
-        root.attributes('-topmost', True)  # 최상단 표시
+        from tkinter import filedialog
+        root = _get_tk_root()
         
         # initialdir 설정: RSA 폴더 우선, 없으면 사용자 홈 드라이브
         initial_dir = str(RSA_ROMFILES_DIR) if os.path.exists(RSA_ROMFILES_DIR) else os.path.expanduser("~")
         
         folder_path = filedialog.askdirectory(
+            parent=root,
             title="롬파일 폴더를 선택하세요",
             initialdir=initial_dir
         )
-        
-        root.destroy()
+        root.update()  # 닫힌 다이얼로그 이벤트 처리 (루트는 다음 선택에 재사용)
         
         if not folder_path:
             print(f"\n{Colors.WARNING}[알림] 폴더 선택이 취소되었습니다.{Colors.ENDC}")
@@ -109,19 +134,28 @@ def find_actual_rom_path(selected_path: str) -> Tuple[Optional[str], bool]:
                 print(f"{Colors.WARNING}  image 폴더를 직접 찾을 수 없습니다. 하위 폴더를 확인합니다...{Colors.ENDC}")
             
             try:
-                items = os.listdir(current_path)
-                subdirs = [item for item in items if os.path.isdir(os.path.join(current_path, item))]
+                # 하위 폴더가 정확히 1개인지만 필요하므로 두 번째 폴더를 만나면 중단
+                # (DirEntry 타입 정보 사용, 항목별 추가 stat 없음)
+                nested_folder = None
+                has_multiple = False
+                with os.scandir(current_path) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            if nested_folder is None:
+                                nested_folder = entry.name
+                            else:
+                                has_multiple = True
+                                break
                 
-                if len(subdirs) == 1:
-                    nested_folder = subdirs[0]
-                    current_path = os.path.join(current_path, nested_folder)
-                    print(f"{Colors.OKCYAN}  → {depth + 1}단계 하위 폴더: {nested_folder}{Colors.ENDC}")
-                elif len(subdirs) == 0:
+                if has_multiple:
+                    print(f"{Colors.FAIL}✗ 하위 폴더가 2개 이상 있습니다. 구조를 확인할 수 없습니다.{Colors.ENDC}")
+                    return None, False
+                elif nested_folder is None:
                     print(f"{Colors.FAIL}✗ 하위 폴더가 없습니다.{Colors.ENDC}")
                     return None, False
                 else:
-                    print(f"{Colors.FAIL}✗ 하위 폴더가 {len(subdirs)}개 있습니다. 구조를 확인할 수 없습니다.{Colors.ENDC}")
-                    return None, False
+                    current_path = os.path.join(current_path, nested_folder)
+                    print(f"{Colors.OKCYAN}  → {depth + 1}단계 하위 폴더: {nested_folder}{Colors.ENDC}")
             
             except Exception as e:
                 print(f"{Colors.FAIL}✗ 폴더 구조 분석 실패: {e}{Colors.ENDC}")
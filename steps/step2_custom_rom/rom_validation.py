@@ -1,6 +1,7 @@
 """ROM 검증 관련 함수들"""
 import os
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, Tuple
 
 from src.config import Colors
 from src.config import UIConstants
@@ -9,6 +10,34 @@ from src.logger import log_error
 from utils.ui import show_popup
 
 
+def _list_image_sizes(image_dir: str) -> Dict[str, int]:
+    """image 폴더 항목 이름 -> 크기 (scandir 1회, 폴더가 없으면 빈 dict)
+    
+    이름은 os.path.normcase로 정규화 (Windows에서는 기존 exists처럼 대소문자 무시)
+    """
+    sizes = {}
+    try:
+        with os.scandir(image_dir) as it:
+            for entry in it:
+                try:
+                    sizes[os.path.normcase(entry.name)] = entry.stat().st_size
+                except OSError:
+                    continue  # 깨진 링크 등은 없는 파일로 취급 (os.path.exists와 동일)
+    except OSError:
+        pass
+    return sizes
+
+
+@lru_cache(maxsize=8)
+def _base_model(device_model: str) -> str:
+    """내수롬 폴더명 비교용 기본 모델명 (TB520FU → TB520)
+    
+    rstrip('FU')는 끝의 F/U 문자를 조합에 상관없이 모두 지우므로(TB520UF, TB520F 등)
+    정확히 'FU' 접미사일 때만 제거합니다.
+    """
+    return device_model[:-2] if device_model.endswith('FU') else device_model
+
+
 def validate_rom_structure(rom_path: str, rom_type: str) -> Tuple[bool, str]:
     """
     롬파일 필수 구조 검증
@@ -18,27 +47,29 @@ def validate_rom_structure(rom_path: str, rom_type: str) -> Tuple[bool, str]:
     """
     print(f"\n{Colors.BOLD}[검증] 롬파일 구조 확인 중...{Colors.ENDC}")
     
-    # 필수 파일 정의
+    # 필수 파일 정의 (image 폴더 기준)
     if rom_type == 'global':
         required_files = [
-            'image/vbmeta.img',
-            'image/vbmeta_system.img',
-            'image/vendor_boot.img',
-            'image/boot.img',
+            'vbmeta.img',
+            'vbmeta_system.img',
+            'vendor_boot.img',
+            'boot.img',
         ]
     else:  # china
         required_files = [
-            'image/vbmeta_system.img',
-            'image/boot.img',
+            'vbmeta_system.img',
+            'boot.img',
         ]
     
-    # 필수 파일 확인
+    # 필수 파일 확인 (파일마다 exists + getsize 대신 폴더 목록 1회 조회)
+    image_sizes = _list_image_sizes(os.path.join(rom_path, 'image'))
     missing_files = []
     
-    for file_path in required_files:
-        full_path = os.path.join(rom_path, file_path)
-        if os.path.exists(full_path):
-            file_size_mb = os.path.getsize(full_path) / (1024*1024)
+    for file_name in required_files:
+        file_path = f"image/{file_name}"
+        file_size = image_sizes.get(os.path.normcase(file_name))
+        if file_size is not None:
+            file_size_mb = file_size / (1024*1024)
             print(f"  ✓ {file_path} ({file_size_mb:.1f} MB)")
         else:
             print(f"  ✗ {file_path} (누락)")
@@ -77,7 +108,7 @@ def verify_model_compatibility(device_model: str, rom_path: str) -> bool:
     
     # 2차 매칭: 부분 모델명 (예: TB520FU → TB520)
     # 내수롬은 보통 TB520만 사용 (FU 없음)
-    base_model = device_model.rstrip('FU')  # TB520FU → TB520
+    base_model = _base_model(device_model)  # TB520FU → TB520
     
     if base_model != device_model and base_model in folder_name:
         print(f"{Colors.OKGREEN}✓ 모델이 일치합니다. (부분 매칭: {base_model}){Colors.ENDC}")
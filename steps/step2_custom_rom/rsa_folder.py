@@ -1,4 +1,5 @@
 """RSA 폴더 관련 함수들"""
+import errno
 import os
 import shutil
 import traceback
@@ -8,11 +9,25 @@ from typing import Tuple, Optional
 from src.config import Colors
 from src.config import UIConstants
 from src.config import TitleMessages
-from src.config import RSA_BASE_DIR, RSA_DOWNLOAD_DIR, RSA_ROMFILES_DIR
+from src.config import RSA_BASE_DIR, RSA_ROMFILES_DIR
 from src.logger import log_error
 from utils.ui import show_popup
 from utils.file_operations import remove_readonly_and_delete
 
+# Windows ERROR_NOT_SAME_DEVICE (다른 드라이브로 이름 변경 시도)
+_WIN_ERROR_NOT_SAME_DEVICE = 17
+
+
+def _move_folder(src: str, dst: str) -> None:
+    """폴더 이동 (같은 드라이브면 이름 변경만, 다른 드라이브면 복사 후 삭제)"""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV and getattr(e, 'winerror', None) != _WIN_ERROR_NOT_SAME_DEVICE:
+            raise
+        print(f"{Colors.OKCYAN}  다른 드라이브로 이동합니다 (복사 후 삭제, 시간이 걸릴 수 있습니다)...{Colors.ENDC}")
+        shutil.move(src, dst)
+
 
 def check_and_prepare_rsa_folder() -> Tuple[bool, str]:
     """
@@ -26,10 +41,10 @@ def check_and_prepare_rsa_folder() -> Tuple[bool, str]:
     print(f"{Colors.BOLD}{'='*60}{Colors.ENDC}")
     
     # 1단계: RSA 기본 폴더 확인 (필수)
-    print(f"\n{Colors.BOLD}[확인 1/3] RSA 설치 확인{Colors.ENDC}")
+    print(f"\n{Colors.BOLD}[확인 1/2] RSA 설치 확인{Colors.ENDC}")
     print(f"  경로: {RSA_BASE_DIR}")
     
-    if not os.path.exists(RSA_BASE_DIR):
+    if not os.path.isdir(RSA_BASE_DIR):
         print(f"{Colors.FAIL}✗ RSA 폴더가 존재하지 않습니다.{Colors.ENDC}")
         
         # NG 팝업 표시
@@ -48,27 +63,13 @@ def check_and_prepare_rsa_folder() -> Tuple[bool, str]:
     
     print(f"{Colors.OKGREEN}✓ RSA가 설치되어 있습니다.{Colors.ENDC}")
     
-    # 2단계: Download 폴더 확인 (자동 생성)
-    print(f"\n{Colors.BOLD}[확인 2/3] Download 폴더 확인{Colors.ENDC}")
-    print(f"  경로: {RSA_DOWNLOAD_DIR}")
-    
-    if not os.path.exists(RSA_DOWNLOAD_DIR):
-        print(f"{Colors.WARNING}✗ Download 폴더가 없습니다. 생성합니다...{Colors.ENDC}")
-        try:
-            os.makedirs(RSA_DOWNLOAD_DIR, exist_ok=True)
-            print(f"{Colors.OKGREEN}✓ Download 폴더를 생성했습니다.{Colors.ENDC}")
-        except Exception as e:
-            print(f"{Colors.FAIL}✗ Download 폴더 생성 실패: {e}{Colors.ENDC}")
-            log_error(f"Download 폴더 생성 실패: {e}", exception=e, context="STEP 0")
-            return False, ""
-    else:
-        print(f"{Colors.OKGREEN}✓ Download 폴더가 존재합니다.{Colors.ENDC}")
-    
-    # 3단계: Romfiles 폴더 확인 (자동 생성)
-    print(f"\n{Colors.BOLD}[확인 3/3] Romfiles 폴더 확인{Colors.ENDC}")
+    # 2단계: Download/Romfiles 폴더 확인 (자동 생성)
+    # Romfiles가 있으면 상위 Download도 있으므로 한 번만 확인하고,
+    # 없으면 makedirs 한 번으로 두 단계를 함께 생성
+    print(f"\n{Colors.BOLD}[확인 2/2] Download/Romfiles 폴더 확인{Colors.ENDC}")
     print(f"  경로: {RSA_ROMFILES_DIR}")
     
-    if not os.path.exists(RSA_ROMFILES_DIR):
+    if not os.path.isdir(RSA_ROMFILES_DIR):
         print(f"{Colors.WARNING}✗ Romfiles 폴더가 없습니다. 생성합니다...{Colors.ENDC}")
         try:
             os.makedirs(RSA_ROMFILES_DIR, exist_ok=True)
@@ -104,12 +105,14 @@ def input_rsa_folder_name(device_model: str, rom_type: str) -> Optional[str]:
     
     if os.path.exists(rsa_romfiles_path):
         try:
-            # .zip.tmp 파일 검색
-            tmp_files = [f for f in os.listdir(rsa_romfiles_path) if f.endswith('.zip.tmp')]
+            # .zip.tmp 파일 검색 (scandir 1회, 수정 시각은 DirEntry 캐시 사용)
+            with os.scandir(rsa_romfiles_path) as it:
+                tmp_files = [(entry.name, entry.stat().st_mtime) for entry in it
+                             if entry.name.endswith('.zip.tmp')]
             
             if tmp_files:
                 # 가장 최근 파일 선택 (여러 개 있을 경우)
-                latest_tmp = max(tmp_files, key=lambda f: os.path.getmtime(os.path.join(rsa_romfiles_path, f)))
+                latest_tmp = max(tmp_files, key=lambda item: item[1])[0]
                 
                 # .zip.tmp 제거하여 폴더 이름 추출
                 auto_detected_name = latest_tmp.replace('.zip.tmp', '')
@@ -284,7 +287,7 @@ def move_to_rsa_folder(patched_rom_path: str, rsa_dir: str, rsa_folder_name: str
     
     # 이동 (잘라내기)
     try:
-        shutil.move(renamed_path, destination_path)
+        _move_folder(renamed_path, destination_path)
         
         print(f"\n{Colors.OKGREEN}✓ 이동 완료!{Colors.ENDC}")
         print(f"  최종 위치: {destination_path}")
@@ -1,5 +1,6 @@
 """STEP 3: 롬파일 패치 (ARB, KSU) - 실제 코드"""
 # 표준 라이브러리
+import mmap
 import os
 import platform
 import re
@@ -8,6 +9,7 @@ import subprocess
 import sys
 import traceback
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -19,31 +21,42 @@ from src.config import (
 )
 from src.config import GKI_REPO_URL, GKI_TAG, KSU_MANAGER_REPO, KSU_MANAGER_TAG, UIConstants
 from src.config import ErrorMessages, TitleMessages
+from src.config import HEX_ROW, HEX_IROW, HEX_PRC, HEX_IPRC
 from src.progress import init_step_progress, update_sub_task, global_print_progress, global_end_progress
 from src.logger import log_command_output, log_error
 from utils.ui import show_popup, get_platform_executable
 from utils.command import run_external_command
 from utils.avb_tools import get_image_avb_details, find_signing_key
 
+# vendor_boot ROW -> PRC 치환표 (같은 길이, 패턴 끝의 \0 제외)
+_REGION_PATCH_TABLE = {
+    HEX_ROW[:-1]: HEX_PRC[:-1],
+    HEX_IROW[:-1]: HEX_IPRC[:-1],
+}
+# ROW/IROW 패턴을 한 번의 스캔으로 찾음
+# 끝의 \0은 lookahead로만 확인해 인접 패턴이 구분자 \0을 공유해도 모두 치환됨
+_REGION_PATCH_RE = re.compile(
+    b'(?:' + b'|'.join(re.escape(old) for old in _REGION_PATCH_TABLE) + b')(?=\x00)'
+)
+
+# 커널 이미지의 'Linux version x.y.z' 배너
+_KERNEL_VERSION_RE = re.compile(rb'Linux version (\d+\.\d+\.\d+)')
+
+
 def extract_kernel_version_from_file(kernel_file_path: Path) -> Optional[str]:
     """커널 파일에서 버전 추출"""
     if not kernel_file_path.exists():
         print(f"  [오류] 커널 파일을 찾을 수 없습니다: '{kernel_file_path}'", file=sys.stderr)
         return None
     try:
-        content = kernel_file_path.read_bytes()
-        potential_strings = re.findall(b'[ -~]{10,}', content)
+        # mmap으로 커널 이미지를 복사 없이 한 번만 스캔 (문자열 목록을 만들지 않음)
         found_version = None
-        for string_bytes in potential_strings:
-            try:
-                line = string_bytes.decode('ascii', errors='ignore')
-                if 'Linux version ' in line:
-                    base_version_match = re.search(r'(\d+\.\d+\.\d+)', line)
-                    if base_version_match:
-                        found_version = base_version_match.group(1)
-                        break
-            except UnicodeDecodeError:
-                continue
+        if kernel_file_path.stat().st_size > 0:
+            with open(kernel_file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                version_match = _KERNEL_VERSION_RE.search(mm)
+                if version_match:
+                    found_version = version_match.group(1).decode('ascii')
         if found_version:
             return found_version
         else:
@@ -58,25 +71,23 @@ def extract_kernel_version_from_file(kernel_file_path: Path) -> Optional[str]:
 
 def patch_region_identifiers(original_vb_path: Path, target_vb_path: Path) -> bool:
     """vendor_boot ROW -> PRC 패치"""
-    from config.constants import HEX_ROW, HEX_IROW, HEX_PRC, HEX_IPRC
-    
-    patterns_to_replace = {
-        HEX_ROW: HEX_PRC,
-        HEX_IROW: HEX_IPRC
-    }
-    
     try:
-        content = original_vb_path.read_bytes()
-        
-        modified_content = content
+        # 원본을 대상 경로로 복사한 뒤 mmap으로 제자리 치환
+        # (치환 전후 길이가 같으므로 파일 전체를 메모리에 읽거나 다시 쓰지 않음)
+        shutil.copyfile(original_vb_path, target_vb_path)
         replacements_made = 0
-        for old_bytes, new_bytes in patterns_to_replace.items():
-            count = modified_content.count(old_bytes)
-            if count > 0:
-                modified_content = modified_content.replace(old_bytes, new_bytes)
-                replacements_made += count
+        if target_vb_path.stat().st_size > 0:
+            with open(target_vb_path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as mm:
+                # 패턴 검색은 1회 스캔, 위치를 먼저 모은 뒤 해당 바이트만 덮어씀
+                matches = [(m.start(), _REGION_PATCH_TABLE[m.group()]) for m in _REGION_PATCH_RE.finditer(mm)]
+                for start, new_bytes in matches:
+                    mm[start:start + len(new_bytes)] = new_bytes
+                if matches:
+                    mm.flush()
+                replacements_made = len(matches)
         
         if replacements_made == 0:
+            target_vb_path.unlink()  # 치환되지 않은 복사본은 남기지 않음
             global_end_progress()
             print(f"\n{Colors.FAIL}[오류 - NG] vendor_boot에서 ROW/IROW 패턴을 찾을 수 없습니다.{Colors.ENDC}", file=sys.stderr)
             show_popup("오류 - NG",
@@ -86,8 +97,6 @@ def patch_region_identifiers(original_vb_path: Path, target_vb_path: Path) -> bo
                       icon=UIConstants.ICON_ERROR)
             return False
         
-        print(f"  {Colors.OKGREEN}패치 적용 후 파일 저장 중...{Colors.ENDC}")
-        target_vb_path.write_bytes(modified_content)
         print(f"  {Colors.OKGREEN}✓ ROW → PRC 패치 완료! ({replacements_made}개 항목){Colors.ENDC}\n")
         return True
     except Exception as e:
@@ -98,6 +107,29 @@ def patch_region_identifiers(original_vb_path: Path, target_vb_path: Path) -> bo
         return False
 
 
+def _fast_copy(src: Path, dst: Path) -> None:
+    """파일 내용만 복사 (메타데이터 제외)
+    
+    os.copy_file_range가 있으면(Linux) 커널 내부 복사를 사용해 reflink 지원 FS에서는
+    데이터 복사 없이 끝나고, 실패하거나 없으면 shutil.copyfile로 복사합니다.
+    """
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    if copy_file_range is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
 def sign_image_with_footer(target_image: Path, info_source_image: Path,
                            override_rollback_index: Optional[str] = None) -> bool:
     """이미지에 AVB 푸터/서명 추가"""
@@ -141,6 +173,30 @@ def sign_image_with_footer(target_image: Path, info_source_image: Path,
     return run_external_command(cmd_add_footer, suppress_output=True)
 
 
+def _fetch_ksu_apk(cmd_params: List[str]) -> Tuple[bool, str]:
+    """KernelSU Manager APK 다운로드 (백그라운드 스레드용)
+    
+    작업 폴더 변경/삭제와 무관하도록 CURRENT_DIR에서 실행하고, 콘솔 출력 없이
+    결과만 반환합니다. 메시지는 호출 측에서 작업 완료 후 출력합니다.
+    
+    Returns:
+        (성공 여부, 실패 시 오류 내용) 튜플
+    """
+    env = os.environ.copy()
+    env['PATH'] = str(TOOL_DIR) + os.pathsep + str(ROOTING_TOOL_DIR) + os.pathsep + env['PATH']
+    try:
+        process = subprocess.run(
+            cmd_params, capture_output=True, text=True,
+            encoding='utf-8', errors='ignore', env=env, cwd=str(CURRENT_DIR)
+        )
+    except OSError as e:
+        log_command_output(cmd_params, "", str(e), False)
+        return False, str(e)
+    success = process.returncode == 0
+    log_command_output(cmd_params, process.stdout, process.stderr, success)
+    return success, "" if success else process.stderr.strip()
+
+
 def perform_boot_patching(image_dir: Path, rb_indices: Optional[Dict[str, str]],
                          current_step: int, total_steps: int) -> int:
     """boot.img를 GKI KernelSU로 패치"""
@@ -163,9 +219,20 @@ def perform_boot_patching(image_dir: Path, rb_indices: Optional[Dict[str, str]],
     os.chdir(TEMP_WORK_DIR)
     
     boot_patched_path = TEMP_WORK_DIR / "boot.img.patched"
+    ksu_executor: Optional[ThreadPoolExecutor] = None
+    ksu_future: Optional[Future] = None
     
     try:
-        shutil.copy(boot_bak_path, TEMP_WORK_DIR / "boot.img")
+        # KernelSU Manager APK는 boot 패치 결과와 무관하므로 GKI 작업과 동시에 미리 다운로드
+        if not list(CURRENT_DIR.glob("KernelSU*.apk")):
+            ksu_apk_cmd = [
+                str(dl_tool), "--repo", f"https://github.com/{KSU_MANAGER_REPO}",
+                "--tag", KSU_MANAGER_TAG, "--release-asset", ".*\\.apk", str(CURRENT_DIR)
+            ]
+            ksu_executor = ThreadPoolExecutor(max_workers=1)
+            ksu_future = ksu_executor.submit(_fetch_ksu_apk, ksu_apk_cmd)
+        
+        _fast_copy(boot_bak_path, TEMP_WORK_DIR / "boot.img")
         extracted_kernel_path = TEMP_WORK_DIR / "kernel"
         
         current_step += 1
@@ -205,9 +272,16 @@ def perform_boot_patching(image_dir: Path, rb_indices: Optional[Dict[str, str]],
         current_step += 1
         print(f"  [{current_step}/{total_steps}] 새 커널 이미지 추출 중...")
         kernel_extract_dir = TEMP_WORK_DIR / "gki_kernel"
-        with zipfile.ZipFile("AnyKernel3.zip", 'r') as zf:
-            zf.extractall(kernel_extract_dir)
         new_kernel_image = kernel_extract_dir / "Image"
+        # 필요한 건 커널 'Image' 하나뿐이므로 해당 항목만 압축 해제
+        with zipfile.ZipFile("AnyKernel3.zip", 'r') as zf:
+            image_member = next(
+                (name for name in zf.namelist() if name.rsplit('/', 1)[-1] == "Image"), None
+            )
+            if image_member is not None:
+                kernel_extract_dir.mkdir(parents=True, exist_ok=True)
+                with zf.open(image_member) as src, open(new_kernel_image, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
         if not new_kernel_image.exists():
             global_end_progress()
             print(f"\n  {Colors.FAIL}[!] 다운로드한 Zip 파일에서 'Image' 파일을 찾을 수 없습니다.{Colors.ENDC}")
@@ -233,13 +307,15 @@ def perform_boot_patching(image_dir: Path, rb_indices: Optional[Dict[str, str]],
         
         current_step += 1
         print(f"  [{current_step}/{total_steps}] KernelSU Manager APK 다운로드 중...")
-        if not list(CURRENT_DIR.glob("KernelSU*.apk")):
-            ksu_apk_cmd = [
-                str(dl_tool), "--repo", f"https://github.com/{KSU_MANAGER_REPO}",
-                "--tag", KSU_MANAGER_TAG, "--release-asset", ".*\\.apk", str(CURRENT_DIR)
-            ]
-            if not run_external_command(ksu_apk_cmd, suppress_output=True):
+        if ksu_future is not None:
+            # 백그라운드 다운로드 완료 대기 후 결과를 여기서 한 번에 출력
+            ksu_ok, ksu_error = ksu_future.result()
+            if not ksu_ok:
+                global_end_progress()
                 sys.stderr.write(f"\n{Colors.WARNING}[경고] KernelSU Manager APK 다운로드에 실패했습니다. (무시하고 계속함){Colors.ENDC}\n")
+                if ksu_error:
+                    for line in ksu_error.split('\n'):
+                        sys.stderr.write(f"  {Colors.WARNING}[STDERR] {line}{Colors.ENDC}\n")
                 sys.stderr.flush()
         
         shutil.move(boot_patched_path, boot_path)
@@ -252,6 +328,9 @@ def perform_boot_patching(image_dir: Path, rb_indices: Optional[Dict[str, str]],
         log_error(error_msg, exception=e, context="STEP 3 - boot 패치")
         return -1
     finally:
+        # 중간 실패 시에도 APK 다운로드가 끝난 뒤 작업 폴더 정리
+        if ksu_executor is not None:
+            ksu_executor.shutdown(wait=True)
         os.chdir(original_cwd)
         if TEMP_WORK_DIR.exists():
             shutil.rmtree(TEMP_WORK_DIR)
@@ -300,7 +379,12 @@ def apply_rollback_indices(image_dir: Path, rb_indices: Dict[str, str],
                 sys.stderr.write(f"\n{Colors.WARNING}[경고] '{boot_bak_path.name}' 백업이 없습니다.{Colors.ENDC}\n")
                 sys.stderr.flush()
             else:
-                shutil.copy2(boot_bak_path, boot_path)
+                # 백업 직후(copy2)처럼 크기/수정 시각이 같으면 원본과 동일하므로 복사 생략
+                bak_stat = boot_bak_path.stat()
+                cur_stat = boot_path.stat() if boot_path.exists() else None
+                if not (cur_stat and cur_stat.st_size == bak_stat.st_size
+                        and cur_stat.st_mtime_ns == bak_stat.st_mtime_ns):
+                    _fast_copy(boot_bak_path, boot_path)
                 if not sign_image_with_footer(boot_path, boot_bak_path, override_rollback_index=new_rb_val):
                     sys.stderr.write(f"\n{Colors.FAIL}[오류] 'boot.img' 롤백 인덱스 갱신 실패.{Colors.ENDC}\n")
                     sys.stderr.flush()
@@ -1,13 +1,17 @@
 """유틸리티 모듈"""
 from .ui import show_popup, show_popup_yesno, clear_screen, get_platform_executable, is_admin
 from .command import run_command, run_adb_command, run_external_command
-from .region_check import check_region_patterns, validate_region_code, check_region_in_image
+from .region_check import (
+    check_region_patterns, validate_region_code, check_region_in_image, find_region_code,
+    vendor_boot_scan_end
+)
 
 __all__ = [
     'show_popup', 'show_popup_yesno', 'clear_screen',
     'run_command', 'run_adb_command', 'run_external_command',
     'get_platform_executable', 'is_admin',
-    'check_region_patterns', 'validate_region_code', 'check_region_in_image'
+    'check_region_patterns', 'validate_region_code', 'check_region_in_image', 'find_region_code',
+    'vendor_boot_scan_end'
 ]
 
 # 지연 로딩 (순환 참조 방지)
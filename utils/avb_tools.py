@@ -1,57 +1,145 @@
 """AVB 관련 유틸리티 함수"""
+import importlib.util
+import io
+import os
 import sys
-import subprocess
 import re
+import struct
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict
+from types import ModuleType
+from typing import Optional, Dict, Tuple, Union
 
 from src.config import Colors
-from src.config import TOOL_DIR, KNOWN_SIGNING_KEYS, PYTHON_EXE
+from src.config import KNOWN_SIGNING_KEYS, PYTHON_EXE, AVBTOOL_PY
+from src.logger import log_error
 from src.progress import global_end_progress
+from utils.command import run_command
 
+# avbtool info_image 출력 캐시: (절대 경로, mtime_ns, 크기) -> 출력
+_AVB_CACHE_MAXSIZE = 16
+_AVB_CACHE: 'OrderedDict[Tuple[str, int, int], str]' = OrderedDict()
+_AVB_CACHE_LOCK = threading.Lock()
 
-def get_image_avb_details(image_path: Path) -> Optional[Dict]:
-    """이미지의 AVB 메타데이터 파싱"""
-    cmd_params = [PYTHON_EXE, str(TOOL_DIR / "avbtool.py"), "info_image", "--image", str(image_path)]
-    try:
-        process = subprocess.run(
-            cmd_params, check=True, capture_output=True,
-            text=True, encoding='utf-8', errors='ignore'
+# AVB 바이너리 레이아웃 (avbtool.py의 AvbFooter / AvbVBMetaHeader FORMAT_STRING 기준)
+_AVB_FOOTER_MAGIC = b'AVBf'
+_AVB_FOOTER_SIZE = 64
+_AVB_FOOTER_VBMETA_OFFSET = 20   # '!4s2LQ' 다음: VBMeta blob 오프셋 (uint64)
+_AVB_HEADER_MAGIC = b'AVB0'
+_AVB_HEADER_ROLLBACK_OFFSET = 112  # '!4s2L2QL2Q2Q2Q2Q2Q' 다음: rollback_index (uint64)
+
+
+@lru_cache(maxsize=1)
+def _load_avbtool() -> ModuleType:
+    """Tools/avbtool.py를 모듈로 로드 (최초 1회)"""
+    spec = importlib.util.spec_from_file_location("avbtool", AVBTOOL_PY)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_avbtool_info(image_path: Union[str, Path]) -> Tuple[bool, str]:
+    """avbtool info_image 실행 후 출력 반환
+    
+    기본은 프로세스 내에서 avbtool을 호출해 인터프리터 기동 비용을 없앱니다.
+    환경 변수 AVBTOOL_SUBPROCESS=1이면 기존처럼 별도 프로세스로 실행합니다.
+    
+    Returns:
+        (성공 여부, info_image 출력) 튜플
+    """
+    if os.environ.get('AVBTOOL_SUBPROCESS') == '1':
+        success, output, _ = run_command(
+            [PYTHON_EXE, AVBTOOL_PY, "info_image", "--image", str(image_path)],
+            f"avbtool.py로 '{image_path}' 분석"
         )
-        output = process.stdout.strip()
-        info = {}
-        prop_args = []
-        patterns = {
-            'header_image_size': r"^\s*Image Size:\s*(\d+)\s*bytes",
-            'partition_size': r"^(?:Image size|Original image size):\s*(\d+)\s*bytes",
-            'name': r"Partition Name:\s*(\S+)",
-            'rollback_index': r"Rollback Index:\s*(\d+)",
-            'salt': r"Salt:\s*([0-9a-fA-F]+)",
-            'algorithm': r"Algorithm:\s*(\S+)",
-            'pubkey_sha1': r"Public key \(sha1\):\s*([0-9a-fA-F]+)",
-            'vbmeta_offset': r"VBMeta offset:\s+(\d+)",
-            'vbmeta_size': r"VBMeta size:\s+(\d+)",
-        }
-        for key, pattern in patterns.items():
-            match = re.search(pattern, output, re.MULTILINE)
-            if match:
-                info[key] = match.group(1)
-        if 'partition_size' not in info and 'header_image_size' in info:
-            info['partition_size'] = info['header_image_size']
-        for line in output.split('\n'):
-            if line.strip().startswith("Prop:"):
-                parts = line.split('->')
-                key_part = parts[0].split(':')[-1].strip()
-                val_part = parts[1].strip()[1:-1]
-                info[key_part] = val_part
-                prop_args.extend(["--prop", f"{key_part}:{val_part}"])
-        info['prop_args'] = prop_args
-        return info
-    except subprocess.CalledProcessError as e:
+        return success, output
+    
+    try:
+        avbtool = _load_avbtool()
+        buffer = io.StringIO()
+        avbtool.Avb().info_image(str(image_path), buffer, False)
+        return True, buffer.getvalue()
+    except Exception as e:
+        print(f"[실패] avbtool.py로 '{image_path}' 분석 실패: {e}")
+        log_error(f"avbtool info_image 실패: {image_path}", exception=e, context="AVB 분석")
+        return False, ""
+
+
+def read_avb_rollback_index(image_path: Union[str, Path]) -> Optional[int]:
+    """avbtool 없이 이미지에서 롤백 인덱스를 직접 읽음
+    
+    vbmeta 이미지는 파일 앞의 헤더(AVB0)를, 해시 푸터가 붙은 이미지(boot 등)는
+    마지막 64바이트 푸터(AVBf)가 가리키는 VBMeta 헤더를 읽습니다.
+    
+    Returns:
+        롤백 인덱스 또는 None (AVB 구조가 아니거나 읽기 실패 시)
+    """
+    header_len = _AVB_HEADER_ROLLBACK_OFFSET + 8
+    try:
+        with open(image_path, 'rb') as f:
+            header = f.read(header_len)
+            if header[:4] != _AVB_HEADER_MAGIC:
+                file_size = f.seek(0, os.SEEK_END)
+                if file_size < _AVB_FOOTER_SIZE:
+                    return None
+                f.seek(file_size - _AVB_FOOTER_SIZE)
+                footer = f.read(_AVB_FOOTER_SIZE)
+                if footer[:4] != _AVB_FOOTER_MAGIC:
+                    return None
+                vbmeta_offset, = struct.unpack_from('!Q', footer, _AVB_FOOTER_VBMETA_OFFSET)
+                f.seek(vbmeta_offset)
+                header = f.read(header_len)
+                if header[:4] != _AVB_HEADER_MAGIC:
+                    return None
+            rollback_index, = struct.unpack_from('!Q', header, _AVB_HEADER_ROLLBACK_OFFSET)
+            return rollback_index
+    except (OSError, struct.error):
+        return None
+
+
+def get_image_avb_details(image_path: Path) -> Optional[Dict]:
+    """이미지의 AVB 메타데이터 파싱
+    
+    avbtool 출력은 cached_avbtool_info()로 (경로, 수정 시각, 크기) 기준 캐시되므로
+    같은 이미지를 여러 단계에서 분석해도 avbtool은 한 번만 실행됩니다.
+    """
+    success, output = cached_avbtool_info(image_path)
+    if not success:
         global_end_progress()
-        print(f"\n  {Colors.FAIL}[오류] '{image_path.name}'의 AVB 정보 분석 실패.{Colors.ENDC}", file=sys.stderr)
-        print(f"{Colors.FAIL}{e.stderr.strip()}{Colors.ENDC}", file=sys.stderr)
+        print(f"\n  {Colors.FAIL}[오류] '{Path(image_path).name}'의 AVB 정보 분석 실패.{Colors.ENDC}", file=sys.stderr)
         return None
+    
+    output = output.strip()
+    info = {}
+    prop_args = []
+    patterns = {
+        'header_image_size': r"^\s*Image Size:\s*(\d+)\s*bytes",
+        'partition_size': r"^(?:Image size|Original image size):\s*(\d+)\s*bytes",
+        'name': r"Partition Name:\s*(\S+)",
+        'rollback_index': r"Rollback Index:\s*(\d+)",
+        'salt': r"Salt:\s*([0-9a-fA-F]+)",
+        'algorithm': r"Algorithm:\s*(\S+)",
+        'pubkey_sha1': r"Public key \(sha1\):\s*([0-9a-fA-F]+)",
+        'vbmeta_offset': r"VBMeta offset:\s+(\d+)",
+        'vbmeta_size': r"VBMeta size:\s+(\d+)",
+    }
+    for key, pattern in patterns.items():
+        match = re.search(pattern, output, re.MULTILINE)
+        if match:
+            info[key] = match.group(1)
+    if 'partition_size' not in info and 'header_image_size' in info:
+        info['partition_size'] = info['header_image_size']
+    for line in output.split('\n'):
+        if line.strip().startswith("Prop:"):
+            parts = line.split('->')
+            key_part = parts[0].split(':')[-1].strip()
+            val_part = parts[1].strip()[1:-1]
+            info[key_part] = val_part
+            prop_args.extend(["--prop", f"{key_part}:{val_part}"])
+    info['prop_args'] = prop_args
+    return info
 
 
 def find_signing_key(pubkey_hash: str) -> Optional[Path]:
@@ -62,3 +150,29 @@ def find_signing_key(pubkey_hash: str) -> Optional[Path]:
         print(f"\n  {Colors.FAIL}[오류] 알 수 없는 서명 키 해시입니다: {pubkey_hash}{Colors.ENDC}", file=sys.stderr)
     return key_file
 
+
+def cached_avbtool_info(image_path: Union[str, Path]) -> Tuple[bool, str]:
+    """run_avbtool_info()의 캐시 버전
+    
+    파일 경로/수정 시각/크기가 같으면 이전 분석 결과를 재사용합니다.
+    (GPT 에러 후 재시도 등 같은 이미지를 반복 분석하는 경우)
+    """
+    try:
+        st = os.stat(image_path)
+    except OSError:
+        return run_avbtool_info(image_path)
+    
+    key = (os.path.abspath(image_path), st.st_mtime_ns, st.st_size)
+    with _AVB_CACHE_LOCK:
+        if key in _AVB_CACHE:
+            _AVB_CACHE.move_to_end(key)
+            return True, _AVB_CACHE[key]
+    
+    success, output = run_avbtool_info(image_path)
+    if success:
+        with _AVB_CACHE_LOCK:
+            _AVB_CACHE[key] = output
+            _AVB_CACHE.move_to_end(key)
+            while len(_AVB_CACHE) > _AVB_CACHE_MAXSIZE:
+                _AVB_CACHE.popitem(last=False)
+    return success, output
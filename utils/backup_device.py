@@ -94,7 +94,7 @@ def _analyze_device_info(
     info(f"지역 코드 확인됨", region_code=region_code)
     
     # vbmeta에서 국가 코드, 모델, 롬 버전 확인
-    model, country_code, rom_version, _ = check_vbmeta_props(slot_suffix)
+    model, country_code, rom_version, _, _ = check_vbmeta_props(slot_suffix)
     if not model:
         raise ModelInfoCheckError(ErrorMessages.MODEL_INFO_CHECK_FAILED)
     info(f"모델 정보 확인됨", model=model, country_code=country_code, rom_version=rom_version)
@@ -3,14 +3,25 @@ import os
 import shutil
 import stat
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, TYPE_CHECKING
+from typing import Any, Callable, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from core.context import CopyProgressTracker
 
 from src.config import Colors
 
+# 병렬 복사 시 진행률 카운터/출력 보호
+_progress_lock = threading.Lock()
+
+# 파일 수가 이보다 적으면 스레드 풀 없이 순차 복사
+PARALLEL_COPY_MIN_FILES = 32
+
+# 기본 복사 스레드 수 (HDD에서 탐색이 과도해지지 않도록 작게 유지)
+DEFAULT_COPY_THREADS = 4
+
 
 def _get_long_path(path: str) -> str:
     """Windows 긴 경로 지원을 위한 경로 변환"""
@@ -28,7 +39,8 @@ def _get_long_path(path: str) -> str:
     return path
 
 
-def copy_with_progress(src: str, dst: str, tracker: 'CopyProgressTracker') -> None:
+def copy_with_progress(src: str, dst: str, tracker: 'CopyProgressTracker',
+                       preserve_metadata: bool = True, show_progress: bool = True) -> None:
     """
     진행률 표시하며 파일 복사 (긴 경로 지원)
     
@@ -36,6 +48,9 @@ def copy_with_progress(src: str, dst: str, tracker: 'CopyProgressTracker') -> No
         src: 원본 파일 경로
         dst: 대상 파일 경로
         tracker: CopyProgressTracker 인스턴스
+        preserve_metadata: False면 copyfile로 내용만 복사 (시간/플래그/xattr 복사 생략,
+                           Windows 외에는 실행 권한 유지를 위해 권한 비트만 복사)
+        show_progress: False면 카운터만 올리고 진행률 바는 출력하지 않음
     """
     try:
         # 긴 경로 지원
@@ -47,21 +62,18 @@ def copy_with_progress(src: str, dst: str, tracker: 'CopyProgressTracker') -> No
         if not os.path.exists(dst_dir):
             os.makedirs(dst_dir, exist_ok=True)
         
-        shutil.copy2(long_src, long_dst)
-        tracker.increment()
+        # copyfile은 OS 고속 복사(sendfile 등)를 사용, 진행률은 파일 단위로 갱신
+        if preserve_metadata:
+            shutil.copy2(long_src, long_dst)
+        else:
+            shutil.copyfile(long_src, long_dst)
+            if os.name != 'nt':
+                shutil.copymode(long_src, long_dst)
         
-        if tracker.total_file_count > 0:
-            percent = (tracker.copied_file_count / tracker.total_file_count) * 100
-            bar_length = 40
-            filled = int(bar_length * tracker.copied_file_count / tracker.total_file_count)
-            bar = '█' * filled + '-' * (bar_length - filled)
-            
-            sys.stdout.write(
-                f"\r  복사 중: [{Colors.OKGREEN}{bar}{Colors.ENDC}] "
-                f"{tracker.copied_file_count}/{tracker.total_file_count} "
-                f"{Colors.OKBLUE}({percent:.1f}%){Colors.ENDC}"
-            )
-            sys.stdout.flush()
+        with _progress_lock:
+            tracker.increment()
+            if show_progress:
+                print_copy_progress(tracker)
     except Exception as e:
         from core.logger import log_error
         error_msg = f"파일 복사 실패: {src}"
@@ -69,6 +81,22 @@ def copy_with_progress(src: str, dst: str, tracker: 'CopyProgressTracker') -> No
         log_error(error_msg, exception=e, context="파일 복사")
 
 
+def print_copy_progress(tracker: 'CopyProgressTracker') -> None:
+    """복사 진행률 바 출력"""
+    if tracker.total_file_count > 0:
+        percent = (tracker.copied_file_count / tracker.total_file_count) * 100
+        bar_length = 40
+        filled = int(bar_length * tracker.copied_file_count / tracker.total_file_count)
+        bar = '█' * filled + '-' * (bar_length - filled)
+        
+        sys.stdout.write(
+            f"\r  복사 중: [{Colors.OKGREEN}{bar}{Colors.ENDC}] "
+            f"{tracker.copied_file_count}/{tracker.total_file_count} "
+            f"{Colors.OKBLUE}({percent:.1f}%){Colors.ENDC}"
+        )
+        sys.stdout.flush()
+
+
 def remove_readonly_and_delete(path: Path) -> None:
     """읽기 전용 파일을 삭제 가능하게 만들고 삭제"""
     def remove_readonly(func: Callable, file_path: str, excinfo: Any) -> None:
@@ -94,12 +122,81 @@ def safe_delete_tree(directory: Path) -> bool:
         return False
 
 
-def get_total_files(src_dir: str) -> int:
-    """폴더 내 총 파일 개수 계산 (긴 경로 지원)"""
-    count = 0
-    # Windows 긴 경로 지원
-    long_path = _get_long_path(src_dir)
-    for root, _, files in os.walk(long_path):
-        count += len(files)
-    return count
+def _get_copy_threads() -> int:
+    """복사 스레드 수 (환경 변수 ROM_COPY_THREADS, 기본 DEFAULT_COPY_THREADS)"""
+    try:
+        return max(1, int(os.environ.get('ROM_COPY_THREADS', DEFAULT_COPY_THREADS)))
+    except ValueError:
+        return DEFAULT_COPY_THREADS
+
+
+def _enumerate_tree(src_root: str) -> Tuple[List[str], List[str]]:
+    """scandir 1회 순회로 하위 폴더/파일 상대 경로 수집
+    
+    DirEntry의 타입 정보를 사용하므로 항목별 추가 stat이 없습니다.
+    
+    Returns:
+        (폴더 상대 경로 리스트, 파일 상대 경로 리스트)
+    """
+    dirs: List[str] = []
+    files: List[str] = []
+    stack = ['']
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(os.path.join(src_root, rel_dir) if rel_dir else src_root) as it:
+            for entry in it:
+                rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                if entry.is_dir():
+                    dirs.append(rel_path)
+                    stack.append(rel_path)
+                else:
+                    files.append(rel_path)
+    return dirs, files
+
 
+def copy_tree_parallel(src_dir: str, dst_dir: str, tracker: 'CopyProgressTracker',
+                       max_workers: Optional[int] = None, preserve_metadata: bool = True,
+                       show_progress: bool = True,
+                       cancel_event: Optional[threading.Event] = None) -> None:
+    """
+    폴더 트리 복사 (파일 복사는 스레드 풀로 병렬 처리, 긴 경로 지원)
+    
+    scandir 1회 순회로 폴더 구조를 먼저 만든 뒤 파일 목록을 스레드 풀에 나눠 복사합니다.
+    파일 수가 PARALLEL_COPY_MIN_FILES 미만이면 순차 복사합니다.
+    
+    Args:
+        src_dir: 원본 폴더
+        dst_dir: 대상 폴더
+        tracker: CopyProgressTracker 인스턴스 (총 개수는 여기서 설정)
+        max_workers: 스레드 수 (None이면 ROM_COPY_THREADS 또는 DEFAULT_COPY_THREADS)
+        preserve_metadata: False면 파일 시간/권한 복사 생략
+        show_progress: False면 진행률 바 출력 생략 (백그라운드 복사용)
+        cancel_event: set되면 아직 시작하지 않은 파일 복사를 건너뜀
+    """
+    long_src = _get_long_path(src_dir)
+    long_dst = _get_long_path(dst_dir)
+    
+    # 한 번의 순회 결과로 폴더 생성과 파일 복사 목록을 모두 처리
+    dirs, files = _enumerate_tree(long_src)
+    os.makedirs(long_dst, exist_ok=True)
+    for rel_dir in dirs:
+        os.makedirs(os.path.join(long_dst, rel_dir), exist_ok=True)
+    file_pairs = [(os.path.join(long_src, rel), os.path.join(long_dst, rel)) for rel in files]
+    
+    tracker.reset()
+    tracker.set_total(len(file_pairs))
+    
+    def _copy(src: str, dst: str) -> None:
+        if cancel_event is not None and cancel_event.is_set():
+            return
+        copy_with_progress(src, dst, tracker, preserve_metadata, show_progress)
+    
+    workers = max_workers or _get_copy_threads()
+    if workers <= 1 or len(file_pairs) < PARALLEL_COPY_MIN_FILES:
+        for src, dst in file_pairs:
+            _copy(src, dst)
+        return
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for src, dst in file_pairs:
+            executor.submit(_copy, src, dst)
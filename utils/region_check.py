@@ -1,29 +1,116 @@
 """지역 코드 검사 유틸리티"""
 # 표준 라이브러리
+import struct
 from typing import Optional, Tuple
 
 # 로컬 모듈
 from src.config import HEX_PRC, HEX_IPRC, HEX_ROW, HEX_IROW
 
+# PRC/IPRC, ROW/IROW 패턴이 공통으로 끝나는 부분 ("PRC\0", "ROW\0")
+_PRC_CORE = HEX_PRC[2:]
+_ROW_CORE = HEX_ROW[2:]
+# 전체 패턴에서 공통 부분이 시작하는 위치
+_CORE_OFFSET = len(HEX_PRC) - len(_PRC_CORE)
 
-def check_region_patterns(data: bytes) -> Tuple[bool, bool, bool, bool]:
+# vendor_boot 헤더 (system/tools/mkbootimg의 vendor_boot_img_hdr_v3/v4, little-endian)
+_VENDOR_BOOT_MAGIC = b'VNDRBOOT'
+_VENDOR_BOOT_V3_FIELDS = struct.Struct('<8s2I8xI')      # magic, header_version, page_size, vendor_ramdisk_size
+_VENDOR_BOOT_V3_TAIL = struct.Struct('<2I')             # header_size, dtb_size (오프셋 2096)
+_VENDOR_BOOT_V3_TAIL_OFFSET = 2096
+_VENDOR_BOOT_V4_FIELDS = struct.Struct('<I8xI')          # vendor_ramdisk_table_size, bootconfig_size (오프셋 2112)
+_VENDOR_BOOT_V4_FIELDS_OFFSET = 2112
+
+
+def vendor_boot_scan_end(data: bytes) -> int:
+    """vendor_boot 헤더에서 실제 내용(헤더+ramdisk+dtb 등)이 끝나는 위치 계산
+    
+    파티션 크기로 만든 이미지 뒤쪽의 0 패딩과 AVB 푸터는 Hex 검색에서 제외합니다.
+    헤더를 해석할 수 없으면(vendor_boot가 아니면) 전체 길이를 반환합니다.
+    """
+    size = len(data)
+    try:
+        magic, version, page_size, ramdisk_size = _VENDOR_BOOT_V3_FIELDS.unpack_from(data, 0)
+        if magic != _VENDOR_BOOT_MAGIC or version < 3 or page_size == 0:
+            return size
+        header_size, dtb_size = _VENDOR_BOOT_V3_TAIL.unpack_from(data, _VENDOR_BOOT_V3_TAIL_OFFSET)
+        sections = [header_size, ramdisk_size, dtb_size]
+        if version >= 4:
+            sections.extend(_VENDOR_BOOT_V4_FIELDS.unpack_from(data, _VENDOR_BOOT_V4_FIELDS_OFFSET))
+    except struct.error:
+        return size
+    
+    # 각 섹션은 page_size 단위로 정렬되어 저장됨
+    end = sum((length + page_size - 1) // page_size * page_size for length in sections)
+    return end if 0 < end <= size else size
+
+
+def _find_from_core(data: bytes, pattern: bytes, core_pos: int, end: int) -> bool:
+    """공통 부분이 처음 나온 위치부터 end까지 전체 패턴 검색
+    
+    전체 패턴은 공통 부분을 포함하므로 첫 공통 부분보다 앞에서는 일치할 수 없습니다.
+    """
+    return data.find(pattern, max(0, core_pos - _CORE_OFFSET), end) != -1
+
+
+def check_region_patterns(data: bytes, end: Optional[int] = None) -> Tuple[bool, bool, bool, bool]:
     """
     Hex 패턴 확인
     
     Args:
-        data: 검사할 바이너리 데이터
+        data: 검사할 바이너리 데이터 (bytes 또는 mmap)
+        end: 검색할 끝 위치 (None이면 vendor_boot_scan_end()로 계산, 슬라이스 복사 없이 범위만 제한)
     
     Returns:
         (prc_found, iprc_found, row_found, irow_found)
     """
+    # 공통 부분이 없는 계열은 전체 패턴 검색을 건너뜀 (보통 한 계열만 존재)
+    # 있으면 전체 패턴은 첫 공통 부분 위치부터만 검색 (앞부분 재스캔 생략)
+    # find()는 첫 일치에서 멈추고 mmap에서도 동작 (mmap에는 count()가 없음)
+    # 모든 호출 경로가 같은 판정을 내리도록 기본 검색 범위는 vendor_boot 헤더 기준
+    if end is None:
+        end = vendor_boot_scan_end(data)
+    prc_pos = data.find(_PRC_CORE, 0, end)
+    row_pos = data.find(_ROW_CORE, 0, end)
+    has_prc = prc_pos != -1
+    has_row = row_pos != -1
     return (
-        data.count(HEX_PRC) > 0,
-        data.count(HEX_IPRC) > 0,
-        data.count(HEX_ROW) > 0,
-        data.count(HEX_IROW) > 0
+        has_prc and _find_from_core(data, HEX_PRC, prc_pos, end),
+        has_prc and _find_from_core(data, HEX_IPRC, prc_pos, end),
+        has_row and _find_from_core(data, HEX_ROW, row_pos, end),
+        has_row and _find_from_core(data, HEX_IROW, row_pos, end)
     )
 
 
+def find_region_code(data: bytes) -> Optional[str]:
+    """
+    우선순위(IROW > ROW > IPRC > PRC)에 따라 처음 확인되는 지역 코드 반환
+    
+    혼합 여부 검증 없이 표시용 지역 코드만 필요할 때 사용합니다.
+    우선순위가 높은 패턴이 발견되면 나머지 패턴은 검색하지 않습니다.
+    검색 범위는 check_region_patterns()와 같이 vendor_boot_scan_end()까지입니다.
+    
+    Args:
+        data: 검사할 바이너리 데이터 (bytes 또는 mmap)
+    
+    Returns:
+        "IROW", "ROW", "IPRC", "PRC" 중 하나, 또는 None (패턴 없음)
+    """
+    end = vendor_boot_scan_end(data)
+    row_pos = data.find(_ROW_CORE, 0, end)
+    if row_pos != -1:
+        if _find_from_core(data, HEX_IROW, row_pos, end):
+            return "IROW"
+        if _find_from_core(data, HEX_ROW, row_pos, end):
+            return "ROW"
+    prc_pos = data.find(_PRC_CORE, 0, end)
+    if prc_pos != -1:
+        if _find_from_core(data, HEX_IPRC, prc_pos, end):
+            return "IPRC"
+        if _find_from_core(data, HEX_PRC, prc_pos, end):
+            return "PRC"
+    return None
+
+
 def validate_region_code(data: bytes) -> Optional[str]:
     """
     지역 코드 검증 및 반환
@@ -44,9 +44,22 @@ def show_popup_yesno(title: str, message: str) -> int:
         print("(팝업 표시 실패)")
         return 7
 
+# 화면 지우기 + 스크롤백 지우기 + 커서 홈 (Windows는 config에서 ANSI 활성화됨)
+_ANSI_CLEAR = "\033[2J\033[3J\033[H"
+
+
 def clear_screen() -> None:
-    """화면 지우기"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """화면 지우기
+    
+    콘솔이면 ANSI 시퀀스로 지우고, 리다이렉트 등 터미널이 아니면
+    기존처럼 cls/clear를 실행합니다.
+    """
+    # stdout이 isatty 없는 래퍼로 교체된 경우 터미널이 아닌 것으로 처리
+    if getattr(sys.stdout, "isatty", lambda: False)():
+        sys.stdout.write(_ANSI_CLEAR)
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
 
 def get_platform_executable(name: str) -> Path:
     """운영체제에 맞는 도구 경로 반환"""